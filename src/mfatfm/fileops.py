@@ -3,38 +3,65 @@
 from __future__ import annotations
 
 import os
+import shutil
 import stat
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Iterable, List, Optional, Tuple
 
 import paramiko
 
-@dataclass
+@dataclass(slots=True)
 class FileEntry:
-    """Light weight description of a directory entry."""
+    """Light weight description of a directory entry.
+
+    Slotted: large listings hold one instance per entry, so skipping the
+    per-instance ``__dict__`` keeps memory down and attribute reads fast.
+    """
 
     name: str
     is_dir: bool
     size: int
     modified: float
     item_count: Optional[int] = None
+    # Case-folded name, computed once so sorting and type-ahead don't
+    # re-fold every name on each refresh.
+    sort_name: str = field(init=False, repr=False, compare=False)
+    # (name, metadata) row text, filled by the UI on first bind and reused
+    # whenever the row is recycled.
+    display: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        folded = self.name.casefold()
+        # Most names are already lower case; share the name string then
+        # instead of keeping an equal copy per entry.
+        self.sort_name = self.name if folded == self.name else folded
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 def _human_size(n: int) -> str:
     """Convert bytes to human readable format."""
-    for unit in ("B", "KB", "MB", "GB", "TB", "PB"):
-        if n < 1024 or unit == "PB":
-            return f"{n:.0f} {unit}" if n >= 10 or unit == "B" else f"{n:.1f} {unit}"
-        n /= 1024
-    return "0 B"
+    if n < 1024:
+        return f"{n:.0f} B"
+    # Each unit spans 10 bits, so the bit length picks it with one division
+    idx = min((int(n).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    value = n / (1 << (idx * 10))
+    return f"{value:.0f} {_SIZE_UNITS[idx]}" if value >= 10 else f"{value:.1f} {_SIZE_UNITS[idx]}"
 
 def _human_time(ts: float) -> str:
     """Convert timestamp to human readable format."""
     try:
-        return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+        # The format stops at minutes, so every timestamp within one minute
+        # shares a cached string.
+        return _format_minute(int(ts // 60))
     except Exception:
         return "—"
 
+@lru_cache(maxsize=4096)
+def _format_minute(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60).strftime("%Y-%m-%d %H:%M")
+
 def _mode_to_str(mode: int) -> str:
     """Convert file mode to string representation like -rw-r--r--."""
     is_dir = "d" if stat.S_ISDIR(mode) else "-"
@@ -46,43 +73,76 @@ def _mode_to_str(mode: int) -> str:
         perm += r + w + x
     return is_dir + perm
 
+_S_IFMT = 0o170000
+
 def stat_isdir(attr: paramiko.SFTPAttributes) -> bool:
     """Return ``True`` when the attribute represents a directory."""
 
-    return bool(attr.st_mode & 0o40000)
+    # Compare the whole type field: sockets and block devices share the
+    # directory bit, and servers may omit the mode entirely.
+    return (attr.st_mode or 0) & _S_IFMT == stat.S_IFDIR
 
 def walk_remote(sftp: paramiko.SFTPClient, root: str) -> Iterable[Tuple[str, List[str], List[str]]]:
     """Yield a remote directory tree similar to :func:`os.walk`."""
 
+    for current, dirs, files in walk_remote_attr(sftp, root):
+        yield current, dirs, [attr.filename for attr in files]
+
+def walk_remote_attr(
+    sftp: paramiko.SFTPClient, root: str
+) -> Iterable[Tuple[str, List[str], List[paramiko.SFTPAttributes]]]:
+    """Like :func:`walk_remote` but keep the listing attributes of files.
+
+    Callers can reuse ``st_size`` instead of issuing a ``STAT`` per file.
+    """
+
     dirs: List[str] = []
-    files: List[str] = []
+    files: List[paramiko.SFTPAttributes] = []
     for entry in sftp.listdir_attr(root):
         if stat_isdir(entry):
             dirs.append(entry.filename)
         else:
-            files.append(entry.filename)
+            files.append(entry)
     yield root, dirs, files
     for directory in dirs:
         new_root = os.path.join(root, directory)
-        yield from walk_remote(sftp, new_root)
+        yield from walk_remote_attr(sftp, new_root)
 
 def normalize_local_path(path: Optional[str]) -> str:
     """Expand user and resolve an absolute local filesystem path."""
     expanded = os.path.expanduser(path or "/")
+    # Lexical normalization is enough for absolute paths; only consult the
+    # working directory when the path is genuinely relative.
+    if os.path.isabs(expanded):
+        return os.path.normpath(expanded)
     return os.path.abspath(expanded)
 
-def load_local_directory(path: str) -> Tuple[str, List[FileEntry]]:
-    """Return normalized path and entries for a local directory."""
+def load_local_directory(path: str, needs_metadata: bool = True) -> Tuple[str, List[FileEntry]]:
+    """Return normalized path and entries for a local directory.
+
+    With ``needs_metadata=False`` no entry is stat'ed: the type comes from
+    ``d_type`` and ``size`` is left at ``-1`` to mark the listing name-only.
+    """
     normalized = normalize_local_path(path)
     if not os.path.isdir(normalized):
         raise NotADirectoryError(f"Not a directory: {normalized}")
 
     entries: List[FileEntry] = []
     with os.scandir(normalized) as it:
+        if not needs_metadata:
+            for dirent in it:
+                try:
+                    is_dir = dirent.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                entries.append(FileEntry(name=dirent.name, is_dir=is_dir, size=-1, modified=0.0))
+            return normalized, entries
+
         for dirent in it:
             try:
                 stat_result = dirent.stat(follow_symlinks=False)
-                is_dir = dirent.is_dir(follow_symlinks=False)
+                # Reuse the mode we already fetched instead of asking again
+                is_dir = stat.S_ISDIR(stat_result.st_mode)
                 item_count: Optional[int] = None
 
                 if is_dir:
@@ -103,3 +163,62 @@ def load_local_directory(path: str) -> Tuple[str, List[FileEntry]]:
                 continue
 
     return normalized, entries
+
+
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_NOFOLLOW", 0)
+_HAVE_FD_REMOVE = (
+    os.scandir in os.supports_fd
+    and {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd
+)
+
+
+def _empty_directory_fd(dir_fd: int) -> None:
+    """Remove everything below the directory open at *dir_fd*.
+
+    All calls are relative to the parent descriptor and the entry type comes
+    from ``d_type``, so no entry is stat'ed or path-resolved from the root.
+    """
+    with os.scandir(dir_fd) as it:
+        children = list(it)
+    for dirent in children:
+        if dirent.is_dir(follow_symlinks=False):
+            child_fd = os.open(dirent.name, _DIR_OPEN_FLAGS, dir_fd=dir_fd)
+            try:
+                _empty_directory_fd(child_fd)
+            finally:
+                os.close(child_fd)
+            os.rmdir(dirent.name, dir_fd=dir_fd)
+        else:
+            os.unlink(dirent.name, dir_fd=dir_fd)
+
+
+def remove_local_tree(path: str) -> None:
+    """Recursively delete the local directory *path*."""
+    if not _HAVE_FD_REMOVE:
+        shutil.rmtree(path)
+        return
+    dir_fd = os.open(path, _DIR_OPEN_FLAGS)
+    try:
+        _empty_directory_fd(dir_fd)
+    finally:
+        os.close(dir_fd)
+    os.rmdir(path)
+
+
+def remove_local_entries(base_dir: str, entries: Iterable[FileEntry]) -> Tuple[int, List[str]]:
+    """Delete *entries* from *base_dir*, returning the count and any errors."""
+    deleted = 0
+    errors: List[str] = []
+    for entry in entries:
+        target_path = os.path.join(base_dir, entry.name)
+        try:
+            if entry.is_dir:
+                remove_local_tree(target_path)
+            else:
+                os.remove(target_path)
+            deleted += 1
+        except FileNotFoundError:
+            errors.append(f"{entry.name} no longer exists")
+        except Exception as exc:
+            errors.append(str(exc))
+    return deleted, errors
@@ -19,17 +19,21 @@ indicators and toast based feedback.
 from __future__ import annotations
 
 import dataclasses
+import functools
 import mimetypes
+import operator
 import os
 import pathlib
 import posixpath
-import shutil
 import stat
 import threading
 import time
+import urllib.parse
+import weakref
+from collections import OrderedDict, deque
 from datetime import datetime
-from concurrent.futures import Future
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 from .connection import AsyncSFTPManager
 from .fileops import (
@@ -39,6 +43,7 @@ from .fileops import (
     _mode_to_str,
     load_local_directory,
     normalize_local_path,
+    remove_local_entries,
 )
 
 from gi.repository import Adw, Gio, GLib, GObject, Gdk, Gtk, Pango
@@ -115,6 +120,141 @@ def _ensure_drop_zone_css() -> None:
     _DROP_ZONE_CSS_PROVIDER = provider
 
 
+# Characters GLib leaves unescaped in the path component of file:// URIs.
+_URI_PATH_SAFE = "/!$&'()*+,;=:@"
+
+
+def _local_path_to_uri(path: str) -> str:
+    """Return the ``file://`` URI for an absolute local path without GIO."""
+
+    return "file://" + urllib.parse.quote(os.fsencode(path), safe=_URI_PATH_SAFE)
+
+
+def _format_speed(bytes_per_second: float) -> str:
+    """Return a transfer rate such as ``"1.5 MB/s"``."""
+
+    if bytes_per_second > 1024 * 1024:
+        return f"{bytes_per_second / (1024 * 1024):.1f} MB/s"
+    if bytes_per_second > 1024:
+        return f"{bytes_per_second / 1024:.1f} KB/s"
+    return f"{bytes_per_second:.0f} B/s"
+
+
+def _format_eta(seconds: float) -> str:
+    """Return a remaining-time string such as ``"2h 5m remaining"``."""
+
+    if seconds > 3600:
+        hours, rest = divmod(int(seconds), 3600)
+        return f"{hours}h {rest // 60}m remaining"
+    if seconds > 60:
+        return f"{int(seconds) // 60}m remaining"
+    return f"{int(seconds)}s remaining"
+
+
+_STATUS_MARKUP = "<span size='large' weight='bold'>{}</span>"
+
+
+_GENERIC_FILE_ICON = Gio.ThemedIcon.new("text-x-generic-symbolic")
+# Extension -> file icon, resolved the first time each extension is seen so
+# row binds never repeat the MIME lookup.
+_EXT_ICONS: Dict[str, Gio.Icon] = {}
+
+
+def _icon_for_name(name: str) -> Gio.Icon:
+    """Return the symbolic file-type icon for *name*, guessed from its extension."""
+
+    ext = os.path.splitext(name)[1].lower()
+    if not ext:
+        return _GENERIC_FILE_ICON
+    icon = _EXT_ICONS.get(ext)
+    if icon is None:
+        content_type, uncertain = Gio.content_type_guess(name, None)
+        if content_type and not uncertain:
+            icon = Gio.content_type_get_symbolic_icon(content_type)
+        else:
+            icon = _GENERIC_FILE_ICON
+        _EXT_ICONS[ext] = icon
+    return icon
+
+
+def _collect_upload_str(item: str, paths: List[str]) -> None:
+    paths.append(item)
+
+
+def _collect_upload_pure_path(item: pathlib.PurePath, paths: List[str]) -> None:
+    paths.append(str(item))
+
+
+def _collect_upload_gfile(item: Gio.File, paths: List[str]) -> None:
+    local_path = item.get_path()
+    if local_path:
+        paths.append(local_path)
+
+
+def _collect_upload_sequence(items: Iterable[object], paths: List[str]) -> None:
+    for item in items:
+        _collect_upload_paths(item, paths)
+
+
+def _collect_upload_ignore(_item: object, _paths: List[str]) -> None:
+    return None
+
+
+# Upload item collectors keyed by the concrete payload type.  Types not listed
+# here (GIO's private GFile implementations, Path subclasses) are resolved
+# once through ``isinstance`` and then memoised under their own type.
+_UPLOAD_COLLECTORS: Dict[type, Callable[[object, List[str]], None]] = {
+    str: _collect_upload_str,
+    list: _collect_upload_sequence,
+    tuple: _collect_upload_sequence,
+    set: _collect_upload_sequence,
+    frozenset: _collect_upload_sequence,
+    type(None): _collect_upload_ignore,
+}
+
+
+def _resolve_upload_collector(item_type: type) -> Callable[[object, List[str]], None]:
+    if issubclass(item_type, str):
+        collector = _collect_upload_str
+    elif issubclass(item_type, pathlib.PurePath):
+        collector = _collect_upload_pure_path
+    elif issubclass(item_type, Gio.File):
+        collector = _collect_upload_gfile
+    elif issubclass(item_type, (list, tuple, set, frozenset)):
+        collector = _collect_upload_sequence
+    else:
+        collector = _collect_upload_ignore
+    _UPLOAD_COLLECTORS[item_type] = collector
+    return collector
+
+
+def _collect_upload_paths(item: object, paths: List[str]) -> None:
+    """Append the local paths described by an upload payload item."""
+
+    item_type = type(item)
+    collector = _UPLOAD_COLLECTORS.get(item_type)
+    if collector is None:
+        collector = _resolve_upload_collector(item_type)
+    collector(item, paths)
+
+
+def _normalize_upload_payload(payload: object, remote_root: str) -> Tuple[List[str], str]:
+    """Return the local paths and remote destination for an upload payload."""
+
+    if isinstance(payload, dict):
+        destination = payload.get("destination")
+        if isinstance(destination, pathlib.PurePath):
+            remote_root = destination.as_posix()
+        elif isinstance(destination, str) and destination:
+            remote_root = destination
+        payload = payload.get("paths")
+
+    # Local paths are kept as plain strings until they reach the SFTP
+    # manager, which is the only consumer requiring ``Path``.
+    paths: List[str] = []
+    _collect_upload_paths(payload, paths)
+    return paths, remote_root
+
 
 # ---------------------------------------------------------------------------
 # Utility data structures
@@ -122,6 +262,9 @@ def _ensure_drop_zone_css() -> None:
 
 class SFTPProgressDialog(Adw.Window):
     """GNOME HIG-compliant SFTP file transfer progress dialog"""
+
+    # Progress is repainted at most 10 times per second
+    _UPDATE_INTERVAL_MS = 100
     
     def __init__(self, parent=None, operation_type="transfer"):
         super().__init__()
@@ -143,6 +286,15 @@ class SFTPProgressDialog(Adw.Window):
         self.start_time = time.time()
         self.operation_type = operation_type
         self._current_future = None
+        # Latest progress waiting to be painted; updates arriving faster than
+        # _UPDATE_INTERVAL_MS overwrite it instead of queueing more idles.
+        self._pending_update: Optional[Tuple[float, Optional[str], Optional[str]]] = None
+        self._update_scheduled = False
+        # Completed-file increments not yet shown; folded into one idle
+        self._pending_completed = 0
+        self._update_lock = threading.Lock()
+        # Last text pushed to each label; GTK re-lays out even for identical text
+        self._rendered: Dict[Gtk.Widget, str] = {}
         
         self._build_ui()
         
@@ -277,30 +429,44 @@ class SFTPProgressDialog(Adw.Window):
         
         if filename:
             self.current_file = filename
-            self.file_label.set_text(filename)
+            self._set_text(self.file_label, filename)
         
         self.counter_label.set_text(f"0 of {total_files} files")
     
     def update_progress(self, fraction, message=None, current_file=None):
-        """Update progress bar and status"""
-        GLib.idle_add(self._update_progress_ui, fraction, message, current_file)
+        """Update progress bar and status (safe from any thread, coalesced)"""
+        with self._update_lock:
+            self._pending_update = (fraction, message, current_file)
+            if self._update_scheduled:
+                return
+            self._update_scheduled = True
+        GLib.timeout_add(self._UPDATE_INTERVAL_MS, self._flush_progress_update)
+
+    def _flush_progress_update(self):
+        with self._update_lock:
+            pending = self._pending_update
+            self._pending_update = None
+            self._update_scheduled = False
+        if pending is not None:
+            self._update_progress_ui(*pending)
+        return False
     
     def _update_progress_ui(self, fraction, message, current_file):
         """Update UI elements (must be called from main thread)"""
         
         # Update progress bar
-        percentage = int(fraction * 100)
         self.progress_bar.set_fraction(fraction)
-        self.progress_bar.set_text(f"{percentage}%")
+        self._set_text(self.progress_bar, f"{int(fraction * 100)}%")
         
         # Update status message
-        if message:
-            self.status_label.set_markup(f"<span size='large' weight='bold'>{message}</span>")
+        if message and self._rendered.get(self.status_label) != message:
+            self._rendered[self.status_label] = message
+            self.status_label.set_markup(_STATUS_MARKUP.format(GLib.markup_escape_text(message)))
         
         # Update current file
         if current_file:
             self.current_file = current_file
-            self.file_label.set_text(current_file)
+            self._set_text(self.file_label, current_file)
         
         # Calculate and update speed/time estimates
         elapsed = time.time() - self.start_time
@@ -308,45 +474,41 @@ class SFTPProgressDialog(Adw.Window):
             # Calculate transferred bytes and speed
             if self.total_bytes > 0:
                 transferred_bytes = int(self.total_bytes * fraction)
-                bytes_per_second = transferred_bytes / elapsed
-                
-                # Update speed display
-                if bytes_per_second > 1024 * 1024:  # MB/s
-                    speed_text = f"{bytes_per_second / (1024 * 1024):.1f} MB/s"
-                elif bytes_per_second > 1024:  # KB/s
-                    speed_text = f"{bytes_per_second / 1024:.1f} KB/s"
-                else:
-                    speed_text = f"{bytes_per_second:.0f} B/s"
-                
-                self.speed_label.set_text(speed_text)
-                
-                # Show size information
-                transferred_size = self._format_size(transferred_bytes)
-                total_size = self._format_size(self.total_bytes)
-                size_info = f"{transferred_size} of {total_size}"
+                self._set_text(self.speed_label, _format_speed(transferred_bytes / elapsed))
                 
                 # Update file label to show size info
                 if current_file:
-                    self.file_label.set_text(f"{current_file} ({size_info})")
-            
-            # Estimate total time and remaining time
-            estimated_total_time = elapsed / fraction
-            remaining_time = estimated_total_time - elapsed
+                    size_info = f"{_human_size(transferred_bytes)} of {_human_size(self.total_bytes)}"
+                    self._set_text(self.file_label, f"{current_file} ({size_info})")
             
+            # Estimate remaining time from the average rate so far
+            remaining_time = elapsed / fraction - elapsed
             if remaining_time > 0:
-                self.time_label.set_text(self._format_time(remaining_time))
+                self._set_text(self.time_label, _format_eta(remaining_time))
             else:
-                self.time_label.set_text("Almost done…")
+                self._set_text(self.time_label, "Almost done…")
         
         return False
+
+    def _set_text(self, widget, text: str) -> None:
+        if self._rendered.get(widget) != text:
+            self._rendered[widget] = text
+            widget.set_text(text)
     
-    def increment_file_count(self):
-        """Increment completed file counter"""
-        GLib.idle_add(self._increment_file_count_ui)
+    def increment_file_count(self, count=1):
+        """Increment completed file counter (safe from any thread, coalesced)"""
+        with self._update_lock:
+            scheduled = self._pending_completed > 0
+            self._pending_completed += count
+        if not scheduled:
+            GLib.idle_add(self._increment_file_count_ui)
     
     def _increment_file_count_ui(self):
         """Update file counter (must be called from main thread)"""
-        self.files_completed += 1
+        with self._update_lock:
+            count = self._pending_completed
+            self._pending_completed = 0
+        self.files_completed += count
         self.counter_label.set_text(f"{self.files_completed} of {self.total_files} files")
         return False
     
@@ -358,35 +520,15 @@ class SFTPProgressDialog(Adw.Window):
         """Set the total bytes for the operation"""
         self.total_bytes = total_bytes
     
-    def _format_time(self, seconds):
-        """Format time remaining for display"""
-        if seconds > 3600:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m remaining"
-        elif seconds > 60:
-            minutes = int(seconds // 60)
-            return f"{minutes}m remaining"
-        else:
-            return f"{int(seconds)}s remaining"
-    
-    def _format_size(self, size_bytes):
-        """Format file size for display"""
-        if size_bytes >= 1024 * 1024 * 1024:  # GB
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-        elif size_bytes >= 1024 * 1024:  # MB
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        elif size_bytes >= 1024:  # KB
-            return f"{size_bytes / 1024:.1f} KB"
-        else:
-            return f"{size_bytes} bytes"
-    
     def show_completion(self, success=True, error_message=None):
         """Show completion state"""
         GLib.idle_add(self._show_completion_ui, success, error_message)
     
     def _show_completion_ui(self, success, error_message):
         """Update UI to show completion state"""
+        with self._update_lock:
+            # A late coalesced update must not repaint over the final state
+            self._pending_update = None
         if success:
             self.status_icon.set_from_icon_name("emblem-ok-symbolic")
             self.status_icon.remove_css_class("accent")
@@ -418,6 +560,8 @@ class SFTPProgressDialog(Adw.Window):
     def _on_cancel_clicked(self, button):
         """Handle cancel button click"""
         self.is_cancelled = True
+        with self._update_lock:
+            self._pending_update = None
         
         # Cancel the future operation
         if self._current_future and not self._current_future.done():
@@ -445,6 +589,154 @@ class SFTPProgressDialog(Adw.Window):
         print("DEBUG: Cancel operation completed")
 
 
+# A transfer job: display name, a callable that starts the transfer, and
+# whether it copies a whole directory (which reports no byte counts)
+TransferJob = Tuple[str, Callable[[], Future], bool]
+
+
+class _TransferBatch:
+    """Drive a group of transfers under one :class:`SFTPProgressDialog`.
+
+    A single driver thread starts the transfers and waits on them with
+    ``FIRST_COMPLETED``; it is the only place results are collected and
+    cancellation is checked, and it posts to the main loop once per finished
+    member.  The batch quacks like a future (``done``/``cancel``) so the
+    dialog's cancel button can stop every member at once.
+
+    At most ``_MAX_IN_FLIGHT`` transfers are handed to the manager at a time
+    and the next one starts as soon as any finishes.  Transfers have their
+    own manager workers, so directory listings never queue behind a batch.
+
+    Progress is the byte total of the file jobs, with each directory job
+    weighted as one file job that completes all at once.
+    """
+
+    _MAX_IN_FLIGHT = AsyncSFTPManager._MAX_TRANSFER_WORKERS
+
+    def __init__(
+        self,
+        dialog: SFTPProgressDialog,
+        jobs: List[TransferJob],
+        transferred: List[int],
+        total_bytes: int,
+        verb: str,
+        active: set,
+        on_started: Callable[[Future, str], None],
+    ) -> None:
+        self._dialog = dialog
+        self._jobs = jobs
+        self._transferred = transferred
+        self._total_bytes = total_bytes
+        self._verb = verb
+        self._active = active
+        self._on_started = on_started
+        self._in_flight: Dict[Future, str] = {}
+        self._directory_members: Set[Future] = set()
+        self._directory_jobs = sum(1 for job in jobs if job[2])
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._completed = 0
+        self._directories_completed = 0
+        self._finished = False
+
+    def start(self, interval_ms: int) -> None:
+        # Registered alongside its members so closing the window also stops
+        # the driver from starting the remaining jobs.
+        self._active.add(self)
+        threading.Thread(target=self._drive, name="mfatfm-transfer-batch", daemon=True).start()
+        GLib.timeout_add(interval_ms, self._tick)
+
+    def _drive(self) -> None:
+        jobs = iter(self._jobs)
+        errors: List[str] = []
+        in_flight = self._in_flight
+        while True:
+            while len(in_flight) < self._MAX_IN_FLIGHT and not self._cancelled.is_set():
+                job = next(jobs, None)
+                if job is None:
+                    break
+                self._dispatch(job, errors)
+            if not in_flight:
+                break
+            finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            with self._lock:
+                for member in finished:
+                    del in_flight[member]
+            succeeded = 0
+            for member in finished:
+                if member in self._directory_members:
+                    self._directories_completed += 1
+                if member.cancelled():
+                    errors.append("Transfer was cancelled")
+                    continue
+                exc = member.exception()
+                if exc is not None:
+                    errors.append(str(exc))
+                else:
+                    succeeded += 1
+            if succeeded:
+                self._dialog.increment_file_count(succeeded)
+            self._completed += len(finished)
+        GLib.idle_add(self._finish, errors)
+
+    def _dispatch(self, job: TransferJob, errors: List[str]) -> None:
+        name, start, is_directory = job
+        try:
+            future = start()
+        except Exception as exc:
+            errors.append(f"{name}: {exc}")
+            self._completed += 1
+            self._directories_completed += is_directory
+            return
+        with self._lock:
+            self._in_flight[future] = name
+        if is_directory:
+            self._directory_members.add(future)
+        self._active.add(future)
+        future.add_done_callback(self._active.discard)
+        self._on_started(future, name)
+        if self._cancelled.is_set():
+            future.cancel()
+
+    def _finish(self, errors: List[str]) -> bool:
+        self._finished = True
+        self._active.discard(self)
+        if not self._dialog.is_cancelled:
+            self._dialog.show_completion(not errors, errors[0] if errors else None)
+        return False
+
+    def _tick(self) -> bool:
+        if self._finished or self._dialog.is_cancelled:
+            return False
+        if self._total_bytes:
+            file_jobs = len(self._jobs) - self._directory_jobs
+            file_fraction = min(sum(self._transferred) / self._total_bytes, 1.0)
+            fraction = (
+                file_jobs * file_fraction + self._directories_completed
+            ) / len(self._jobs)
+        else:
+            fraction = self._completed / len(self._jobs)
+        self._dialog.update_progress(fraction, self._verb)
+        return True
+
+    @property
+    def dialog(self) -> SFTPProgressDialog:
+        return self._dialog
+
+    def done(self) -> bool:
+        return self._finished
+
+    def cancel(self) -> bool:
+        # Jobs that never started are simply dropped by the driver
+        self._cancelled.set()
+        with self._lock:
+            members = list(self._in_flight)
+        cancelled = False
+        for member in members:
+            cancelled = member.cancel() or cancelled
+        return cancelled or not self._finished
+
+
 @dataclasses.dataclass
   # Number of items in directory (for folders only)
 
@@ -517,6 +809,11 @@ class PaneToolbar(Gtk.Box):
         left.set_margin_start(12)  # Add margin before Remote/Local labels
         left.append(self._pane_label)
         left.append(self.controls)
+        # Shown while a directory listing is being loaded in the background
+        self.spinner = Gtk.Spinner()
+        self.spinner.set_valign(Gtk.Align.CENTER)
+        self.spinner.set_visible(False)
+        left.append(self.spinner)
         bar.append(left)
 
         # Entry (fills all remaining space)
@@ -583,6 +880,26 @@ class PropertiesDialog(Adw.Window):
         super().__init__()
         self._entry = entry
         self._current_path = current_path
+        # Joined once; every row below refers to the same location.
+        self._entry_path = os.path.join(current_path, entry.name)
+        # Stat the entry once up front; every row below reuses the result
+        # instead of probing the filesystem again on the UI thread.
+        self._local_stat: Optional[os.stat_result] = None
+        if "://" not in current_path:
+            try:
+                self._local_stat = os.stat(self._entry_path)
+            except OSError:
+                pass
+        self._is_remote = "://" in current_path or (
+            current_path.startswith("/") and self._local_stat is None
+        )
+        # Name-only local listings carry no size or time; the stat does
+        if self._local_stat is not None and not self._is_remote:
+            self._size = self._local_stat.st_size
+            self._modified = self._local_stat.st_mtime
+        else:
+            self._size = entry.size
+            self._modified = entry.modified
         self._parent_window = parent
         self.set_title("Properties")
         
@@ -677,15 +994,14 @@ class PropertiesDialog(Adw.Window):
             else:
                 summary_parts.append("Folder")
         else:
-            if self._entry.size:
-                summary_parts.append(_human_size(self._entry.size))
+            if self._size > 0:
+                summary_parts.append(_human_size(self._size))
         
         # Add free space for local files
         if not self._is_remote_file():
             try:
-                path = os.path.join(self._current_path, self._entry.name)
-                if os.path.exists(path):
-                    stat = os.statvfs(path)
+                if self._local_stat is not None:
+                    stat = os.statvfs(self._entry_path)
                     free = stat.f_bavail * stat.f_frsize
                     summary_parts.append(f"{_human_size(free)} Free")
             except Exception:
@@ -710,7 +1026,7 @@ class PropertiesDialog(Adw.Window):
             else:
                 size_text = "—"
         else:
-            size_text = _human_size(self._entry.size) if self._entry.size else "—"
+            size_text = _human_size(self._size) if self._size > 0 else "—"
         
         # Store reference to size row for updating
         self._size_row = Adw.ActionRow(title="Size", subtitle=size_text)
@@ -719,7 +1035,7 @@ class PropertiesDialog(Adw.Window):
 
     def _create_parent_folder_row(self) -> Gtk.Widget:
         """Create the parent folder row."""
-        parent_path = os.path.dirname(os.path.join(self._current_path, self._entry.name))
+        parent_path = os.path.dirname(self._entry_path)
         if not parent_path:
             parent_path = "/"
         
@@ -738,7 +1054,7 @@ class PropertiesDialog(Adw.Window):
 
     def _create_modified_row(self) -> Gtk.Widget:
         """Create the modified date row."""
-        modified_time = _human_time(self._entry.modified) if self._entry.modified else "—"
+        modified_time = _human_time(self._modified) if self._modified else "—"
         row = Adw.ActionRow(title="Modified", subtitle=modified_time)
         row.add_css_class("card")
         return row
@@ -751,9 +1067,8 @@ class PropertiesDialog(Adw.Window):
         
         # Try to get creation time for local files
         try:
-            path = os.path.join(self._current_path, self._entry.name)
-            if os.path.exists(path):
-                stat_result = os.stat(path)
+            stat_result = self._local_stat
+            if stat_result is not None:
                 if hasattr(stat_result, 'st_birthtime'):  # macOS
                     created_time = _human_time(stat_result.st_birthtime)
                 elif hasattr(stat_result, 'st_ctime'):  # Linux
@@ -773,15 +1088,9 @@ class PropertiesDialog(Adw.Window):
         """Create the permissions row."""
         # Get actual permissions for local files
         if not self._is_remote_file():
-            try:
-                path = os.path.join(self._current_path, self._entry.name)
-                if os.path.exists(path):
-                    stat_result = os.stat(path)
-                    mode = stat_result.st_mode
-                    perms_text = _mode_to_str(mode)
-                else:
-                    perms_text = "—"
-            except Exception:
+            if self._local_stat is not None:
+                perms_text = _mode_to_str(self._local_stat.st_mode)
+            else:
                 perms_text = "—"
         else:
             # For remote files, show simplified permissions
@@ -798,14 +1107,13 @@ class PropertiesDialog(Adw.Window):
     def _is_remote_file(self) -> bool:
         """Check if this is a remote file (from SFTP)."""
         # Simple heuristic - in a real implementation, you'd pass connection info
-        return "://" in self._current_path or (self._current_path.startswith("/") and 
-                not os.path.exists(os.path.join(self._current_path, self._entry.name)))
+        return self._is_remote
 
     def _on_open_parent(self, *_) -> None:
         """Open parent directory in system file manager."""
         try:
             if not self._is_remote_file():
-                parent_dir = os.path.dirname(os.path.join(self._current_path, self._entry.name))
+                parent_dir = os.path.dirname(self._entry_path)
                 if os.path.exists(parent_dir):
                     Gio.AppInfo.launch_default_for_uri(f"file://{parent_dir}", None)
         except Exception:
@@ -815,7 +1123,7 @@ class PropertiesDialog(Adw.Window):
         """Start calculating folder size in background thread."""
         import threading
         
-        folder_path = os.path.join(self._current_path, self._entry.name)
+        folder_path = self._entry_path
         
         # Create and start the background thread
         thread = threading.Thread(target=self._calculate_folder_size, args=(folder_path,))
@@ -877,6 +1185,17 @@ class FilePane(Gtk.Box):
     """Represents a single pane in the manager."""
 
     _TYPEAHEAD_TIMEOUT = 1.0
+    _MAX_HISTORY = 256
+    # Navigation requests closer together than this collapse into one
+    _PATH_EMIT_INTERVAL_MS = 80
+    # Selection bursts (rubber-band, shift-click) refresh button states once
+    _MENU_STATE_DELAY_MS = 30
+    # Shared icons for row binds; rows only switch icon when the type changes
+    _FOLDER_ICON = Gio.ThemedIcon.new("folder-symbolic")
+    # Listings larger than this are streamed into the list store in chunks so
+    # the first page becomes visible without blocking the main loop.
+    _STORE_CHUNK_THRESHOLD = 4500
+    _STORE_CHUNK_SIZE = 500
 
     __gsignals__ = {
         "path-changed": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
@@ -894,6 +1213,8 @@ class FilePane(Gtk.Box):
         self.append(self.toolbar)
 
         self._is_remote = label.lower() == "remote"
+        # Path flavour for this pane, resolved once
+        self._path_mod = posixpath if self._is_remote else os.path
 
         self._stack = Gtk.Stack()
         self._stack.set_transition_type(Gtk.StackTransitionType.CROSSFADE)
@@ -903,6 +1224,8 @@ class FilePane(Gtk.Box):
         self._list_store = Gio.ListStore(item_type=Gtk.StringObject)
         self._selection_model = Gtk.MultiSelection.new(self._list_store)
 
+        # Row widgets created by the list factory, for in-place updates
+        self._list_rows: "weakref.WeakSet[Gtk.Box]" = weakref.WeakSet()
         list_factory = Gtk.SignalListItemFactory()
         list_factory.connect("setup", self._on_list_setup)
         list_factory.connect("bind", self._on_list_bind)
@@ -912,12 +1235,6 @@ class FilePane(Gtk.Box):
         # Navigate on row activation (double click / Enter)
         self._list_view = list_view
         list_view.connect("activate", self._on_list_activate)
-        self._list_drag_source = Gtk.DragSource()
-        self._list_drag_source.set_actions(Gdk.DragAction.COPY)
-        self._list_drag_source.connect("prepare", self._on_drag_prepare)
-        self._list_drag_source.connect("drag-begin", self._on_drag_begin)
-        self._list_drag_source.connect("drag-end", self._on_drag_end)
-        list_view.add_controller(self._list_drag_source)
 
         # Wrap list view in a scrolled window for proper scrolling
         list_scrolled = Gtk.ScrolledWindow()
@@ -938,12 +1255,6 @@ class FilePane(Gtk.Box):
         self._grid_view = grid_view
         # Navigate on grid item activation (double click / Enter)
         grid_view.connect("activate", self._on_grid_activate)
-        self._grid_drag_source = Gtk.DragSource()
-        self._grid_drag_source.set_actions(Gdk.DragAction.COPY)
-        self._grid_drag_source.connect("prepare", self._on_drag_prepare)
-        self._grid_drag_source.connect("drag-begin", self._on_drag_begin)
-        self._grid_drag_source.connect("drag-end", self._on_drag_end)
-        grid_view.add_controller(self._grid_drag_source)
 
         # Wrap grid view in a scrolled window for proper scrolling
         grid_scrolled = Gtk.ScrolledWindow()
@@ -1095,24 +1406,46 @@ class FilePane(Gtk.Box):
         )
         # Upload/download functionality is now available through action bar and context menu only
 
-        self._history: List[str] = []
+        # Bounded so long sessions don't grow it forever; the deque drops the
+        # oldest entry in O(1) instead of shifting a list.
+        self._history: Deque[str] = deque(maxlen=self._MAX_HISTORY)
         self._current_path = "/"
+        self._at_root = True
         self._entries: List[FileEntry] = []
         self._cached_entries: List[FileEntry] = []
-        self._raw_entries: List[FileEntry] = []
+        # Filtered+sorted views of _cached_entries keyed by
+        # (show_hidden, sort_key, descending); reset on every new listing.
+        self._sorted_cache: Dict[Tuple[bool, str, bool], List[FileEntry]] = {}
         self._show_hidden = False
         self._sort_key = "name"  # Default sort by name
         self._sort_descending = False  # Default ascending order
         self._drag_in_progress = False
         self._drag_payload: Optional[object] = None
+        # Entries captured when the drag started; drop handlers read these
+        # instead of re-querying a selection that may have changed mid-drag.
+        self._drag_payload_entries: List[FileEntry] = []
 
         self._suppress_history_push: bool = False
+        # Set by an explicit refresh so the window bypasses its listing cache
+        self._force_refresh: bool = False
+        # Last path handed to _emit_path_changed
+        self._requested_path: Optional[str] = None
+        self._store_fill_source: int = 0
+        # Selected row indices, rebuilt lazily after the selection or model changes
+        self._selected_indices_cache: Optional[List[int]] = None
+        self._menu_state_source = 0
         self._selection_model.connect("selection-changed", self._on_selection_changed)
+        self._selection_model.connect("items-changed", self._on_selection_items_changed)
 
         self._menu_actions: Dict[str, Gio.SimpleAction] = {}
         self._menu_action_group = Gio.SimpleActionGroup()
         self.insert_action_group("pane", self._menu_action_group)
+        self._context_menu_models: Dict[bool, Gio.Menu] = {}
         self._menu_popover: Gtk.PopoverMenu = self._create_menu_model()
+        # Reused for every right-click; set_pointing_to() copies it.
+        self._ctx_rect = Gdk.Rectangle()
+        self._ctx_rect.width = 1
+        self._ctx_rect.height = 1
         self._add_context_controller(list_view)
         self._add_context_controller(grid_view)
 
@@ -1149,6 +1482,11 @@ class FilePane(Gtk.Box):
         self._typeahead_buffer: str = ""
         self._typeahead_last_time: float = 0.0
 
+        self._last_path_emit: float = 0.0
+        # Held (path, suppress history push) request; see _emit_path_changed
+        self._pending_emit: Optional[Tuple[str, bool]] = None
+        self._path_emit_source = 0
+
     # -- drop zone & drag support -------------------------------------
 
     def set_partner_pane(self, partner: Optional["FilePane"]) -> None:
@@ -1195,12 +1533,16 @@ class FilePane(Gtk.Box):
                 pass
 
     def _setup_drag_sources(self, views: Iterable[Gtk.Widget]) -> None:
+        # One source per view; attaching a second would run every drag
+        # handler twice.
+        if self._drag_sources:
+            return
         for view in views:
             drag_source = Gtk.DragSource()
             drag_source.set_actions(Gdk.DragAction.COPY)
             drag_source.connect("prepare", self._on_drag_prepare)
-            drag_source.connect("drag-begin", self._on_drag_source_begin)
-            drag_source.connect("drag-end", self._on_drag_source_end)
+            drag_source.connect("drag-begin", self._on_drag_begin)
+            drag_source.connect("drag-end", self._on_drag_end)
             try:
                 drag_source.connect("drag-cancel", self._on_drag_source_cancel)
             except (TypeError, AttributeError):
@@ -1208,145 +1550,6 @@ class FilePane(Gtk.Box):
             view.add_controller(drag_source)
             self._drag_sources.append(drag_source)
 
-    def _on_drag_prepare(self, _source: Gtk.DragSource, _x: float, _y: float):
-        print(f"=== DRAG PREPARE CALLED on {'remote' if self._is_remote else 'local'} pane ===")
-        
-        try:
-            entries = self.get_selected_entries()
-            print(f"Selected entries: {[e.name for e in entries] if entries else 'None'}")
-            if not entries:
-                print("No entries selected, returning None")
-                return None
-
-            window = self.get_root()
-            print(f"Window type: {type(window)}")
-            if not isinstance(window, FileManagerWindow):
-                print("No FileManagerWindow found, returning None")
-                return None
-                
-            print(f"Window is FileManagerWindow: {isinstance(window, FileManagerWindow)}")
-            
-        except Exception as e:
-            print(f"Exception in drag prepare early checks: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
-
-        if self._is_remote:
-            # For remote panes, create a string content provider
-            # According to GTK4 docs, we need to use proper GType formats
-            file_names = [entry.name for entry in entries]
-            payload = "\n".join(file_names)
-            print(f"Creating remote drag payload: {payload}")
-            
-            try:
-                # Method 1: Try new_typed if available (GTK 4.6+)
-                if hasattr(Gdk.ContentProvider, 'new_typed'):
-                    provider = Gdk.ContentProvider.new_typed(GObject.TYPE_STRING, payload)
-                    if provider is not None:
-                        print(f"Created new_typed string provider for remote files: {file_names}")
-                        return provider
-                
-                # Method 2: Use new_for_value with proper GValue
-                value = GObject.Value()
-                value.init(GObject.TYPE_STRING)
-                value.set_string(payload)
-                provider = Gdk.ContentProvider.new_for_value(value)
-                if provider is not None:
-                    print(f"Created GValue string provider for remote files: {file_names}")
-                    return provider
-                    
-                print("Both typed methods failed, trying fallback")
-                
-            except Exception as e:
-                print(f"Error creating typed content provider: {e}")
-            
-            # Fallback: Use text/plain MIME type with bytes
-            try:
-                data = GLib.Bytes.new(payload.encode("utf-8"))
-                provider = Gdk.ContentProvider.new_for_bytes("text/plain", data)
-                if provider is not None:
-                    print(f"Created text/plain bytes provider for remote files: {file_names}")
-                    return provider
-                print("text/plain provider creation failed")
-                
-            except Exception as e:
-                print(f"Error creating bytes content provider: {e}")
-                
-            return None
-        else:
-            # For local panes, create URI list as before
-            base_dir = window._normalize_local_path(self.toolbar.path_entry.get_text())
-            uris: List[str] = []
-            files: List[Gio.File] = []
-            for entry in entries:
-                local_path = os.path.join(base_dir, entry.name)
-                if not os.path.exists(local_path):
-                    continue
-                try:
-                    gfile = Gio.File.new_for_path(local_path)
-                except Exception:
-                    continue
-                uri = gfile.get_uri()
-                if not uri:
-                    continue
-                uris.append(uri)
-                files.append(gfile)
-
-            if not uris:
-                return None
-
-            # Create content provider for URI list
-            try:
-                # Use GLib.Bytes for proper data handling
-                payload = ("\r\n".join(uris) + "\r\n").encode("utf-8")
-                data = GLib.Bytes.new(payload)
-                
-                # Create content provider with proper MIME type
-                provider = Gdk.ContentProvider.new_for_bytes("text/uri-list", data)
-                if provider is None:
-                    return None
-                    
-            except Exception as e:
-                print(f"Error creating drag content provider: {e}")
-                return None
-
-            self._current_drag_file = files[0] if files else None
-            return provider
-
-    def _on_drag_source_begin(self, _source: Gtk.DragSource, _drag: Gdk.Drag) -> None:
-        print(f"Drag begin from {'remote' if self._is_remote else 'local'} pane")
-        
-        # Check if we have selected entries
-        selected = self.get_selected_entries()
-        print(f"Selected entries at drag begin: {[e.name for e in selected] if selected else 'None'}")
-        
-        partner = getattr(self, "_partner_pane", None)
-        if partner is not None:
-            print(f"Showing drop zone on {'remote' if partner._is_remote else 'local'} partner pane")
-            partner.show_drop_zone()
-        else:
-            print("No partner pane found!")
-
-        window = self.get_root()
-        if isinstance(window, FileManagerWindow):
-            window._register_drag_begin(self)
-
-
-    def _on_drag_source_end(self, _source: Gtk.DragSource, _drag: Gdk.Drag, _delete: bool) -> None:
-        print(f"Drag end from {'remote' if self._is_remote else 'local'} pane, delete={_delete}")
-        self._current_drag_file = None
-        partner = getattr(self, "_partner_pane", None)
-        if partner is not None:
-            partner.hide_drop_zone()
-            # Also reset pointer state to ensure drop zone hides
-            partner._set_drop_zone_pointer(False)
-
-        window = self.get_root()
-        if isinstance(window, FileManagerWindow):
-            window._register_drag_finish(self)
-
-
     def _on_drag_source_cancel(self, _source: Gtk.DragSource, _drag: Gdk.Drag, _reason) -> None:
         print(f"Drag cancel from {'remote' if self._is_remote else 'local'} pane, reason={_reason}")
         self._current_drag_file = None
@@ -1452,9 +1655,27 @@ class FilePane(Gtk.Box):
         self._stack.set_visible_child_name(view_name)
         # Update the split button icon to reflect current view
         self._update_view_button_icon()
+        self._ensure_local_metadata()
+
+    def needs_metadata(self) -> bool:
+        """Return whether sizes and times are shown or used for sorting."""
+        return self._sort_key != "name" or self._stack.get_visible_child_name() == "list"
+
+    def _ensure_local_metadata(self) -> None:
+        """Rescan a name-only local listing once its metadata is needed.
+
+        Only the metadata changes, so the selection is kept.
+        """
+        if self._is_remote or not self.needs_metadata():
+            return
+        if not any(entry.size < 0 for entry in self._cached_entries):
+            return
+        window = self.get_root()
+        if isinstance(window, FileManagerWindow):
+            window._load_local(self._current_path or "/", preserve_selection=True)
 
     def _on_path_entry(self, entry: Gtk.Entry) -> None:
-        self.emit("path-changed", entry.get_text() or "/")
+        self._emit_path_changed(entry.get_text() or "/")
 
     def _on_list_setup(self, factory: Gtk.SignalListItemFactory, item):
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
@@ -1472,10 +1693,18 @@ class FilePane(Gtk.Box):
         box.append(name_label)
         box.append(metadata_label)
         box.set_hexpand(True)
+        # Tooltips are read from the label text on hover, so binding never
+        # has to touch them.
+        for label in (name_label, metadata_label):
+            label.tooltip_label = label
+            label.set_has_tooltip(True)
+            label.connect("query-tooltip", self._on_cell_query_tooltip)
         # Store references as Python attributes instead of deprecated set_data
         box.icon = icon
         box.name_label = name_label
         box.metadata_label = metadata_label
+        box.bound_entry = None
+        self._list_rows.add(box)
         item.set_child(box)
 
     def _on_list_bind(self, factory, item):
@@ -1490,48 +1719,60 @@ class FilePane(Gtk.Box):
         if position is not None and 0 <= position < len(self._entries):
             entry = self._entries[position]
 
+        box.bound_entry = entry
         if entry is None:
             value = item.get_item().get_string()
             name_label.set_text(value)
-            name_label.set_tooltip_text(value)
             metadata_label.set_text("—")
-            metadata_label.set_tooltip_text(None)
-            icon.set_from_icon_name("folder-symbolic" if value.endswith('/') else "text-x-generic-symbolic")
+            self._set_row_icon(icon, value.endswith('/'), value)
             return
 
-        display_name = entry.name + ("/" if entry.is_dir else "")
+        display = entry.display
+        if display is None:
+            display = entry.display = self._row_text(entry)
+        display_name, metadata_text = display
         name_label.set_text(display_name)
-        name_label.set_tooltip_text(display_name)
+        metadata_label.set_text(metadata_text)
 
-        if entry.is_dir:
-            if entry.item_count is not None:
-                count_text = f"{entry.item_count} items"
-                metadata_label.set_text(count_text)
-                metadata_label.set_tooltip_text(count_text)
-            else:
-                metadata_label.set_text("—")
-                metadata_label.set_tooltip_text(None)
-        else:
-            size_text = self._format_size(entry.size)
-            metadata_label.set_text(size_text)
-            metadata_label.set_tooltip_text(size_text)
+        self._set_row_icon(icon, entry.is_dir, entry.name)
 
-        if entry.is_dir:
-            icon.set_from_icon_name("folder-symbolic")
-        else:
-            icon.set_from_icon_name("text-x-generic-symbolic")
+    def refresh_bound_rows(self) -> None:
+        """Re-render the metadata of bound list rows whose entries changed.
+
+        Used when folder item counts arrive after the listing; touching the
+        row widgets directly keeps the selection, which an ``items-changed``
+        on the store would reset.
+        """
+        for box in self._list_rows:
+            entry = box.bound_entry
+            if entry is not None and entry.display is None:
+                entry.display = self._row_text(entry)
+                box.metadata_label.set_text(entry.display[1])
 
     @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        units = ["KB", "MB", "GB", "TB", "PB"]
-        value = float(size_bytes)
-        for unit in units:
-            value /= 1024.0
-            if value < 1024.0:
-                return f"{value:.1f} {unit}"
-        return f"{value:.1f} EB"
+    def _on_cell_query_tooltip(widget, x, y, keyboard_mode, tooltip) -> bool:
+        text = widget.tooltip_label.get_text()
+        if not text or text == "—":
+            return False
+        tooltip.set_text(text)
+        return True
+
+    @classmethod
+    def _row_text(cls, entry: FileEntry) -> Tuple[str, str]:
+        if entry.is_dir:
+            if entry.item_count is not None:
+                return entry.name + "/", f"{entry.item_count} items"
+            return entry.name + "/", "—"
+        # Name-only listings carry no size yet
+        return entry.name, _human_size(entry.size) if entry.size >= 0 else "—"
+
+    @classmethod
+    def _set_row_icon(cls, image: Gtk.Image, is_dir: bool, name: str) -> None:
+        # Recycled rows usually keep their type, so skip the theme lookup
+        wanted = cls._FOLDER_ICON if is_dir else _icon_for_name(name)
+        if getattr(image, "bound_icon", None) is not wanted:
+            image.set_from_gicon(wanted)
+            image.bound_icon = wanted
 
     def _on_grid_setup(self, factory, item):
         button = Gtk.Button()
@@ -1558,31 +1799,43 @@ class FilePane(Gtk.Box):
         content.append(label)
 
         button.set_child(content)
+        # Bind reads these directly instead of walking the widget tree
+        button.image = image
+        button.label = label
+        button.tooltip_label = label
+        button.set_has_tooltip(True)
+        button.connect("query-tooltip", self._on_cell_query_tooltip)
         item.set_child(button)
 
     def _on_grid_bind(self, factory, item):
-        # Grid view uses the same icon for now but honours the entry name as
-        # tooltip so users can differentiate.
+        # The button's tooltip shows the full entry name so users can
+        # differentiate truncated labels.
         button = item.get_child()
-        content = button.get_child()
-        image = content.get_first_child()
-        label = content.get_last_child()
+        image: Gtk.Image = button.image
+        label: Gtk.Label = button.label
 
         value = item.get_item().get_string()
         display_text = value[:-1] if value.endswith('/') else value
 
         label.set_text(display_text)
-        label.set_tooltip_text(display_text)
-        button.set_tooltip_text(display_text)
 
         # Update the image icon based on type
-        if value.endswith('/'):
-            image.set_from_icon_name("folder-symbolic")
-        else:
-            image.set_from_icon_name("text-x-generic-symbolic")
+        self._set_row_icon(image, value.endswith('/'), display_text)
 
     def _on_selection_changed(self, model, position, n_items):
+        self._selected_indices_cache = None
+        if not self._menu_state_source:
+            self._menu_state_source = GLib.timeout_add(
+                self._MENU_STATE_DELAY_MS, self._flush_menu_state
+            )
+
+    def _flush_menu_state(self) -> bool:
+        self._menu_state_source = 0
         self._update_menu_state()
+        return False
+
+    def _on_selection_items_changed(self, model, position, removed, added):
+        self._selected_indices_cache = None
 
     def _setup_sorting_actions(self) -> None:
         """Set up sorting actions for the split button menu."""
@@ -1615,6 +1868,7 @@ class FilePane(Gtk.Box):
         if self._sort_key != sort_key:
             self._sort_key = sort_key
             self._refresh_sorted_entries(preserve_selection=True)
+            self._ensure_local_metadata()
 
     def _on_sort_direction(self, descending: bool) -> None:
         """Handle sort direction selection from menu."""
@@ -1642,25 +1896,24 @@ class FilePane(Gtk.Box):
         desc_action.set_state(GLib.Variant.new_boolean(self._sort_descending))
 
     def _create_menu_model(self) -> Gtk.PopoverMenu:
-        # Create menu actions first
-        def _add_action(name: str, callback: Callable[[], None]) -> None:
+        # Create menu actions first. Each keeps its own GAction so
+        # _update_menu_state can enable them individually, but they all share
+        # one handler that dispatches on the action name.
+        self._context_actions: Dict[str, Callable[[], None]] = {
+            "download": self._on_menu_download,
+            "upload": self._on_menu_upload,
+            "rename": lambda: self._emit_entry_operation("rename"),
+            "delete": lambda: self._emit_entry_operation("delete"),
+            "new_folder": lambda: self.emit("request-operation", "mkdir", None),
+            "properties": self._on_menu_properties,
+        }
+        for name in self._context_actions:
             if name not in self._menu_actions:
                 action = Gio.SimpleAction.new(name, None)
-
-                def _on_activate(_action: Gio.SimpleAction, _param: Optional[GLib.Variant]) -> None:
-                    callback()
-
-                action.connect("activate", _on_activate)
+                action.connect("activate", self._on_context_action)
                 self._menu_action_group.add_action(action)
                 self._menu_actions[name] = action
 
-        _add_action("download", self._on_menu_download)
-        _add_action("upload", self._on_menu_upload)
-        _add_action("rename", lambda: self._emit_entry_operation("rename"))
-        _add_action("delete", lambda: self._emit_entry_operation("delete"))
-        _add_action("new_folder", lambda: self.emit("request-operation", "mkdir", None))
-        _add_action("properties", self._on_menu_properties)
-
         # Create menu model dynamically based on pane type and selection state
         menu_model = self._create_context_menu_model()
 
@@ -1670,22 +1923,35 @@ class FilePane(Gtk.Box):
         popover.insert_action_group("pane", self._menu_action_group)
         return popover
 
+    def _on_context_action(self, action: Gio.SimpleAction, _param: Optional[GLib.Variant]) -> None:
+        self._context_actions[action.get_name()]()
+
     def _create_context_menu_model(self) -> Gio.Menu:
-        """Create context menu model based on current selection state."""
-        menu_model = Gio.Menu()
-        
+        """Return the context menu model for the current selection state.
+
+        The pane type never changes, so only two models exist; each is built
+        on first use and reused afterwards.
+        """
         # Check if items are selected
         try:
             # Check if _entries is initialized
             if not hasattr(self, '_entries') or not self._entries:
                 has_selection = False
             else:
-                selected_entries = self.get_selected_entries()
-                has_selection = len(selected_entries) > 0
+                has_selection = bool(self._get_selected_indices())
         except AttributeError:
             # Handle case where _entries is not initialized yet (during testing)
             has_selection = False
-        
+
+        models = self._context_menu_models
+        menu_model = models.get(has_selection)
+        if menu_model is None:
+            menu_model = models[has_selection] = self._build_context_menu_model(has_selection)
+        return menu_model
+
+    def _build_context_menu_model(self, has_selection: bool) -> Gio.Menu:
+        menu_model = Gio.Menu()
+
         # Add Download/Upload based on pane type and selection
         if self._is_remote and has_selection:
             menu_model.append("Download", "pane.download")
@@ -1728,6 +1994,7 @@ class FilePane(Gtk.Box):
 
     def _build_drag_payload(self) -> Optional[object]:
         entries = self.get_selected_entries()
+        self._drag_payload_entries = entries
         if not entries:
             return None
 
@@ -1746,7 +2013,7 @@ class FilePane(Gtk.Box):
         else:
             base_dir = os.path.abspath(os.path.expanduser(base_dir))
 
-        return [pathlib.Path(os.path.join(base_dir, entry.name)) for entry in entries]
+        return [os.path.join(base_dir, entry.name) for entry in entries]
 
     def _on_drag_prepare(self, drag_source: Gtk.DragSource, _x: float, _y: float):
         print(f"=== OLD DRAG PREPARE CALLED on {'remote' if self._is_remote else 'local'} pane ===")
@@ -1806,23 +2073,13 @@ class FilePane(Gtk.Box):
             # For local files, try to create URI list
             try:
                 if hasattr(payload, '__iter__') and not isinstance(payload, str):
-                    # Assume payload contains file entries with paths
-                    uris = []
-                    for item in payload:
-                        if hasattr(item, 'name'):
-                            # Build full path and convert to URI
-                            window = self.get_root()
-                            if isinstance(window, FileManagerWindow):
-                                base_dir = window._normalize_local_path(self.toolbar.path_entry.get_text())
-                                full_path = os.path.join(base_dir, item.name)
-                                if os.path.exists(full_path):
-                                    gfile = Gio.File.new_for_path(full_path)
-                                    uri = gfile.get_uri()
-                                    if uri:
-                                        uris.append(uri)
+                    # Payload already holds absolute local paths as strings
+                    # No per-path stat: the paths come from the current listing
+                    uris = [_local_path_to_uri(full_path) for full_path in payload]
                     
                     if uris:
-                        uri_list = "\r\n".join(uris) + "\r\n"
+                        uris.append("")
+                        uri_list = "\r\n".join(uris)
                         data = GLib.Bytes.new(uri_list.encode("utf-8"))
                         provider = Gdk.ContentProvider.new_for_bytes("text/uri-list", data)
                         print(f"Created URI list provider with {len(uris)} URIs")
@@ -1851,6 +2108,10 @@ class FilePane(Gtk.Box):
 
         self._drag_in_progress = True
 
+        partner = getattr(self, "_partner_pane", None)
+        if partner is not None:
+            partner.show_drop_zone()
+
         window = self.get_root()
         if isinstance(window, FileManagerWindow):
             window._register_drag_begin(self)
@@ -1864,6 +2125,14 @@ class FilePane(Gtk.Box):
     ) -> None:
         self._drag_in_progress = False
         self._drag_payload = None
+        self._drag_payload_entries = []
+        self._current_drag_file = None
+
+        partner = getattr(self, "_partner_pane", None)
+        if partner is not None:
+            partner.hide_drop_zone()
+            # Also reset pointer state to ensure drop zone hides
+            partner._set_drop_zone_pointer(False)
 
         window = self.get_root()
         if isinstance(window, FileManagerWindow):
@@ -1878,16 +2147,16 @@ class FilePane(Gtk.Box):
         except Exception:
             pass
         
-        # Create a new menu model based on current selection state
-        new_menu_model = self._create_context_menu_model()
-        self._menu_popover.set_menu_model(new_menu_model)
+        # Swap the model only when the selection state changed; setting it
+        # rebuilds the popover's contents.
+        menu_model = self._create_context_menu_model()
+        if self._menu_popover.get_menu_model() is not menu_model:
+            self._menu_popover.set_menu_model(menu_model)
         
-        # Create a rectangle for the popover positioning
-        rect = Gdk.Rectangle()
+        # Point the popover at the click position
+        rect = self._ctx_rect
         rect.x = int(x)
         rect.y = int(y)
-        rect.width = 1
-        rect.height = 1
         
         # Set parent and show popover
         if self._menu_popover.get_parent() != widget:
@@ -1906,9 +2175,21 @@ class FilePane(Gtk.Box):
         pass
 
     def _get_selected_indices(self) -> List[int]:
+        cached = self._selected_indices_cache
+        if cached is not None:
+            return cached
+
         indices: List[int] = []
         total = len(self._entries)
-        if hasattr(self._selection_model, "is_selected"):
+        get_selection = getattr(self._selection_model, "get_selection", None)
+        if callable(get_selection):
+            # Walk only the set bits instead of probing every row.
+            bitset = get_selection()
+            valid, bitset_iter, index = Gtk.BitsetIter.init_first(bitset)
+            while valid and index < total:
+                indices.append(index)
+                valid, index = bitset_iter.next()
+        elif hasattr(self._selection_model, "is_selected"):
             for index in range(total):
                 try:
                     if self._selection_model.is_selected(index):
@@ -1924,6 +2205,7 @@ class FilePane(Gtk.Box):
                     selected_index = None
                 if isinstance(selected_index, int) and 0 <= selected_index < total:
                     indices.append(selected_index)
+        self._selected_indices_cache = indices
         return indices
 
     def _get_primary_selection_index(self) -> Optional[int]:
@@ -2026,22 +2308,17 @@ class FilePane(Gtk.Box):
                     file_names = [name.strip() for name in value.strip().split('\n') if name.strip()]
                     print(f"Parsed file names: {file_names}")
                     if file_names:
-                        # Get the selected entries from the origin pane
-                        selected_entries = origin.get_selected_entries()
+                        # Use the entries captured when the drag started
+                        selected_entries = list(origin._drag_payload_entries) or origin.get_selected_entries()
                         print(f"Selected entries from origin: {[e.name for e in selected_entries]}")
                         
                         # Get current directory on local pane (destination)
                         local_dir = self.toolbar.path_entry.get_text() or os.path.expanduser("~")
-                        destination = pathlib.Path(window._normalize_local_path(local_dir))
+                        destination = window._normalize_local_path(local_dir)
                         print(f"Local destination directory: {destination}")
                         
-                        # Test if files would conflict
-                        for entry in selected_entries:
-                            target_path = destination / entry.name
-                            exists = target_path.exists()
-                            print(f"  {entry.name} -> {target_path} (exists: {exists})")
-                        
-                        # Create proper download payload
+                        # Create proper download payload; the download handler
+                        # wraps the destination in a Path once at its boundary.
                         payload = {
                             "entries": selected_entries,
                             "destination": destination,
@@ -2118,7 +2395,7 @@ class FilePane(Gtk.Box):
             return
 
         base_dir = window._normalize_local_path(local_pane.toolbar.path_entry.get_text())
-        source_paths = [pathlib.Path(os.path.join(base_dir, entry.name)) for entry in entries]
+        source_paths = [os.path.join(base_dir, entry.name) for entry in entries]
 
         destination = destination_pane.toolbar.path_entry.get_text() or "/"
         payload = {"paths": source_paths, "destination": destination}
@@ -2151,7 +2428,7 @@ class FilePane(Gtk.Box):
         payload = {
             "entries": entries,
             "directory": self._current_path,
-            "destination": pathlib.Path(destination_root),
+            "destination": destination_root,
         }
         self.emit("request-operation", "download", payload)
         if len(entries) == 1:
@@ -2167,17 +2444,25 @@ class FilePane(Gtk.Box):
         return error.matches(Gio.IOErrorEnum, Gio.IOErrorEnum.CANCELLED)
 
     def _build_properties_details(self, entry: FileEntry) -> Dict[str, str]:
-        base_path = self._current_path or "/"
-        location = os.path.join(base_path, entry.name)
+        location = self._join_current(entry.name)
 
         entry_type = "Folder" if entry.is_dir else "File"
-        if entry.is_dir:
+        size, modified = entry.size, entry.modified
+        if not self._is_remote and size < 0:
+            # From a name-only listing; stat it for the real values
+            try:
+                stat_result = os.stat(location)
+            except OSError:
+                modified = None
+            else:
+                size, modified = stat_result.st_size, stat_result.st_mtime
+        if entry.is_dir or size < 0:
             size_text = "—"
         else:
-            size_text = self._format_size(entry.size)
+            size_text = _human_size(size)
 
         try:
-            modified_dt = datetime.fromtimestamp(entry.modified)
+            modified_dt = datetime.fromtimestamp(modified)
             modified_text = modified_dt.strftime("%Y-%m-%d %H:%M:%S")
         except (OSError, OverflowError, ValueError, TypeError):
             modified_text = "Unknown"
@@ -2195,10 +2480,9 @@ class FilePane(Gtk.Box):
         if entry is None:
             self.show_toast("Select a single item to view properties")
             return
-        details = self._build_properties_details(entry)
-        self._show_properties_dialog(entry, details)
+        self._show_properties_dialog(entry)
 
-    def _show_properties_dialog(self, entry: FileEntry, details: Dict[str, str]) -> None:
+    def _show_properties_dialog(self, entry: FileEntry) -> None:
         """Show modern properties dialog."""
         window = self.get_root()
         if window is None:
@@ -2209,7 +2493,9 @@ class FilePane(Gtk.Box):
             dialog = PropertiesDialog(entry, self._current_path, window)
             dialog.present()
         except Exception as e:
-            # Fallback to simple message dialog if modern dialog fails
+            # Fallback to simple message dialog if modern dialog fails; its
+            # text is only formatted on this path.
+            details = self._build_properties_details(entry)
             self._show_fallback_properties_dialog(entry, details, window)
 
     def _show_fallback_properties_dialog(self, entry: FileEntry, details: Dict[str, str], window: Gtk.Window) -> None:
@@ -2250,11 +2536,16 @@ class FilePane(Gtk.Box):
 
     # -- public API -----------------------------------------------------
 
-    def show_entries(self, path: str, entries: Iterable[FileEntry]) -> None:
+    def show_entries(
+        self, path: str, entries: Iterable[FileEntry], *, preserve_selection: bool = False
+    ) -> None:
         self._current_path = path
+        # Only "/" (or an empty path) strips down to nothing
+        self._at_root = not path.rstrip("/")
         self.toolbar.path_entry.set_text(path)
         self._cached_entries = list(entries)
-        self._apply_entry_filter(preserve_selection=False)
+        self._sorted_cache.clear()
+        self._apply_entry_filter(preserve_selection=preserve_selection)
 
     def highlight_entry(self, name: str) -> None:
         if not name:
@@ -2276,28 +2567,78 @@ class FilePane(Gtk.Box):
             for entry in self.get_selected_entries():
                 selected_names.add(entry.name)
 
-        # Filter for hidden files and store as raw entries
-        self._raw_entries = [
-            entry
-            for entry in self._cached_entries
-            if self._show_hidden or not entry.name.startswith(".")
-        ]
-
-        # Apply sorting to get final entries
-        self._entries = self._sort_entries(self._raw_entries)
+        # Filter hidden files and sort in a single pass, reusing the result
+        # when only the hidden toggle or sort order flips back.
+        view_key = (self._show_hidden, self._sort_key, self._sort_descending)
+        sorted_entries = self._sorted_cache.get(view_key)
+        if sorted_entries is None:
+            sorted_entries = self._filter_and_sort_entries(self._cached_entries)
+            self._sorted_cache[view_key] = sorted_entries
+        self._entries = sorted_entries
         
-        # Update the list store
-        self._list_store.remove_all()
         restored_selection: List[int] = []
-        for idx, entry in enumerate(self._entries):
-            suffix = "/" if entry.is_dir else ""
-            self._list_store.append(Gtk.StringObject.new(entry.name + suffix))
-            if preserve_selection and entry.name in selected_names:
-                restored_selection.append(idx)
+        if preserve_selection and selected_names:
+            restored_selection = [
+                idx for idx, entry in enumerate(self._entries) if entry.name in selected_names
+            ]
+
+        # Replace the list store contents with a single splice so the views
+        # see one items-changed emission instead of one per entry.
+        self._cancel_store_fill()
+        entries = self._entries
+        if len(entries) > self._STORE_CHUNK_THRESHOLD:
+            first = self._STORE_CHUNK_SIZE
+            self._list_store.splice(
+                0, self._list_store.get_n_items(), self._make_store_items(entries[:first])
+            )
+            self._store_fill_source = GLib.idle_add(
+                self._fill_store_chunk, entries, first, restored_selection
+            )
+            return
+
+        self._list_store.splice(
+            0, self._list_store.get_n_items(), self._make_store_items(entries)
+        )
+        self._finish_store_fill(restored_selection)
+
+    @staticmethod
+    def _make_store_items(entries: Iterable[FileEntry]) -> List[Gtk.StringObject]:
+        return [
+            Gtk.StringObject.new(entry.name + "/" if entry.is_dir else entry.name)
+            for entry in entries
+        ]
+
+    def _fill_store_chunk(
+        self, entries: List[FileEntry], offset: int, restored_selection: List[int]
+    ) -> bool:
+        if entries is not self._entries:
+            # A newer refresh replaced the listing; stop streaming stale data.
+            self._store_fill_source = 0
+            return False
+        end = offset + self._STORE_CHUNK_SIZE
+        self._list_store.splice(offset, 0, self._make_store_items(entries[offset:end]))
+        if end < len(entries):
+            self._store_fill_source = GLib.idle_add(
+                self._fill_store_chunk, entries, end, restored_selection
+            )
+        else:
+            self._store_fill_source = 0
+            self._finish_store_fill(restored_selection)
+        return False
+
+    def _cancel_store_fill(self) -> None:
+        if self._store_fill_source:
+            GLib.source_remove(self._store_fill_source)
+            self._store_fill_source = 0
 
+    def _finish_store_fill(self, restored_selection: List[int]) -> None:
         self._selection_model.unselect_all()
         for index in restored_selection:
             self._selection_model.select_item(index, False)
+        if restored_selection:
+            # Replacing the store resets the scroll position; keep the
+            # selection in view instead of jumping back to the top.
+            self._scroll_to_position(restored_selection[0])
 
         self._update_menu_state()
 
@@ -2309,22 +2650,37 @@ class FilePane(Gtk.Box):
         if position is not None and 0 <= position < len(self._entries):
             entry = self._entries[position]
             if entry.is_dir:
-                self.emit("path-changed", os.path.join(self._current_path, entry.name))
-
-    def _sort_entries(self, entries: Iterable[FileEntry]) -> List[FileEntry]:
-        def key_func(item: FileEntry):
-            if self._sort_key == "size":
-                return item.size
-            if self._sort_key == "modified":
-                return item.modified
-            return item.name.casefold()
+                self._emit_path_changed(self._join_current(entry.name))
+
+    def _join_current(self, name: str) -> str:
+        """Join ``name`` onto the current directory using this pane's flavour."""
+        return self._path_mod.join(self._current_path or "/", name)
+
+    def _filter_and_sort_entries(self, entries: Iterable[FileEntry]) -> List[FileEntry]:
+        # Resolve the key once instead of dispatching on _sort_key per item.
+        if self._sort_key == "size":
+            key_func = operator.attrgetter("size")
+        elif self._sort_key == "modified":
+            key_func = operator.attrgetter("modified")
+        else:
+            key_func = operator.attrgetter("sort_name")
 
-        dirs = [entry for entry in entries if entry.is_dir]
-        files = [entry for entry in entries if not entry.is_dir]
+        dirs: List[FileEntry] = []
+        files: List[FileEntry] = []
+        add_dir = dirs.append
+        add_file = files.append
+        if self._show_hidden:
+            for entry in entries:
+                (add_dir if entry.is_dir else add_file)(entry)
+        else:
+            for entry in entries:
+                # A one-character slice is cheaper than startswith(".")
+                if entry.name[:1] != ".":
+                    (add_dir if entry.is_dir else add_file)(entry)
 
-        dirs_sorted = sorted(dirs, key=key_func, reverse=self._sort_descending)
-        files_sorted = sorted(files, key=key_func, reverse=self._sort_descending)
-        return dirs_sorted + files_sorted
+        dirs.sort(key=key_func, reverse=self._sort_descending)
+        files.sort(key=key_func, reverse=self._sort_descending)
+        return dirs + files
 
     def _refresh_sorted_entries(self, *, preserve_selection: bool) -> None:
         # Simply re-apply the filter which now includes sorting
@@ -2334,25 +2690,73 @@ class FilePane(Gtk.Box):
         if position is not None and 0 <= position < len(self._entries):
             entry = self._entries[position]
             if entry.is_dir:
-                self.emit("path-changed", os.path.join(self._current_path, entry.name))
+                self._emit_path_changed(self._join_current(entry.name))
 
     def _on_up_clicked(self, _button) -> None:
-        parent = os.path.dirname(self._current_path.rstrip('/')) or '/'
         # Avoid navigating past root repeatedly
+        if self._at_root:
+            return
+        parent = self._path_mod.dirname(self._current_path.rstrip('/')) or '/'
         if parent != self._current_path:
-            self.emit("path-changed", parent)
+            self._emit_path_changed(parent)
 
     def _on_back_clicked(self, _button) -> None:
         prev = self.pop_history()
         if prev:
             # Suppress history push for back navigation
             self._suppress_history_push = True
-            self.emit("path-changed", prev)
+            self._emit_path_changed(prev)
 
     def _on_refresh_clicked(self, _button) -> None:
         # Refresh the current directory
         current_path = self._current_path or "/"
-        self.emit("path-changed", current_path)
+        self._force_refresh = True
+        self._emit_path_changed(current_path)
+
+    def _emit_path_changed(self, path: str) -> None:
+        """Emit ``path-changed``, coalescing bursts of navigation.
+
+        The first request goes out at once; requests arriving within
+        ``_PATH_EMIT_INTERVAL_MS`` of the last emission are held and only the
+        latest is emitted when the interval ends, so held keys or rapid
+        clicks trigger one listing instead of many. Navigating to the
+        directory already shown is dropped unless a refresh was requested.
+        """
+        if (
+            not self._force_refresh
+            and path == self._current_path
+            and path == self._requested_path
+        ):
+            self._suppress_history_push = False
+            return
+        self._requested_path = path
+        if self._path_emit_source:
+            self._hold_path_emit(path)
+            return
+        elapsed_ms = (time.monotonic() - self._last_path_emit) * 1000
+        if elapsed_ms >= self._PATH_EMIT_INTERVAL_MS:
+            self._last_path_emit = time.monotonic()
+            self.emit("path-changed", path)
+            return
+        self._hold_path_emit(path)
+        self._path_emit_source = GLib.timeout_add(
+            max(1, int(self._PATH_EMIT_INTERVAL_MS - elapsed_ms)), self._flush_path_emit
+        )
+
+    def _hold_path_emit(self, path: str) -> None:
+        # The Back flag travels with the held path, so a newer request
+        # replacing a held Back navigation still records its history.
+        self._pending_emit = (path, self._suppress_history_push)
+        self._suppress_history_push = False
+
+    def _flush_path_emit(self) -> bool:
+        self._path_emit_source = 0
+        pending, self._pending_emit = self._pending_emit, None
+        if pending is not None:
+            path, self._suppress_history_push = pending
+            self._last_path_emit = time.monotonic()
+            self.emit("path-changed", path)
+        return False
 
     def push_history(self, path: str) -> None:
         if self._history and self._history[-1] == path:
@@ -2365,6 +2769,12 @@ class FilePane(Gtk.Box):
             return self._history[-1]
         return None
 
+    def set_loading(self, loading: bool) -> None:
+        """Toggle the busy spinner shown in the pane header."""
+        spinner = self.toolbar.spinner
+        spinner.set_visible(loading)
+        spinner.set_spinning(loading)
+
     def show_toast(self, text: str) -> None:
         """Show a toast message safely."""
         try:
@@ -2400,7 +2810,7 @@ class FilePane(Gtk.Box):
         prefix_casefold = prefix.casefold()
         for offset in range(total):
             index = (start + offset) % total
-            if self._entries[index].name.casefold().startswith(prefix_casefold):
+            if self._entries[index].sort_name.startswith(prefix_casefold):
                 return index
         return None
 
@@ -2509,6 +2919,19 @@ class FilePane(Gtk.Box):
 class FileManagerWindow(Adw.Window):
     """Top-level window hosting two :class:`FilePane` instances."""
 
+    # Number of directory listings kept per side for instant back/forward
+    _DIR_CACHE_SIZE = 32
+    # Remote listings have no cheap change indicator, so they expire quickly
+    _REMOTE_CACHE_TTL = 10.0
+    # The directory mtime misses files rewritten in place and changes inside
+    # subdirectories, so local listings expire too, just for back/forward
+    _LOCAL_CACHE_TTL = 5.0
+    # Bursts of post-operation refreshes (e.g. multi-delete) are coalesced
+    # into a single listing per target within this window.
+    _REFRESH_DEBOUNCE_MS = 50
+    # Batched transfer progress is pushed to the dialog at most 10 times/s
+    _PROGRESS_INTERVAL_MS = 100
+
     def __init__(
         self,
         application: Adw.Application,
@@ -2527,9 +2950,6 @@ class FileManagerWindow(Adw.Window):
         self.set_resizable(True)
         # Ensure window decorations are shown (minimize, maximize, close buttons)
         self.set_decorated(True)
-        
-        # Progress state
-        self._current_future: Optional[Future] = None
 
         # Use ToolbarView like other Adw.Window instances
         toolbar_view = Adw.ToolbarView()
@@ -2557,6 +2977,11 @@ class FileManagerWindow(Adw.Window):
         # Create toast overlay first and set it as toolbar content
         self._toast_overlay = Adw.ToastOverlay()
         self._progress_dialog: Optional[SFTPProgressDialog] = None
+        # The batch driving the newest dialog; while set, the manager's
+        # per-file "progress" signals are not forwarded to it
+        self._active_batch: Optional[_TransferBatch] = None
+        # Every transfer dialog still alive; closed dialogs drop out by themselves
+        self._progress_dialogs: "weakref.WeakSet[SFTPProgressDialog]" = weakref.WeakSet()
         self._connection_error_reported = False
         toolbar_view.set_content(self._toast_overlay)
         toolbar_view.add_top_bar(header_bar)
@@ -2600,10 +3025,34 @@ class FileManagerWindow(Adw.Window):
 
         self._active_drag_source: Optional[FilePane] = None
 
+        # Local directory scans run on a dedicated worker so that large or
+        # slow (e.g. network mounted) folders never block the main loop.
+        self._local_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mfatfm-local"
+        )
+        self._local_load_future: Optional[Future] = None
+        self._local_load_seq = 0
+
+        # Directory listing caches, both expiring after a short TTL.  Local
+        # listings are keyed by normalized path and also validated against
+        # the directory mtime; remote listings are keyed by resolved path.
+        self._local_dir_cache: "OrderedDict[str, Tuple[float, int, bool, List[FileEntry]]]" = OrderedDict()
+        self._local_dir_cache_lock = threading.Lock()
+        self._remote_dir_cache: "OrderedDict[str, Tuple[float, List[FileEntry]]]" = OrderedDict()
+        # Outstanding folder item-count request per pane
+        self._count_futures: Dict[FilePane, Future] = {}
+        self._refresh_sources: Dict[object, int] = {}
+        # Transfers still in flight; each future removes itself on completion
+        # so closing the window only has to cancel live work.
+        self._active_transfers: set[Future] = set()
+        self.connect("close-request", self._on_close_request)
+
+        # Resolved once; the local home does not change for the window's lifetime
+        self._local_home = os.path.expanduser("~")
 
         # Prime the left (local) pane immediately with local home directory
         try:
-            local_home = os.path.expanduser("~")
+            local_home = self._local_home
             self._load_local(local_home)
             self._left_pane.push_history(local_home)
         except Exception as exc:
@@ -2740,6 +3189,10 @@ class FileManagerWindow(Adw.Window):
 
 
     def _on_progress(self, _manager, fraction: float, message: str) -> None:
+        # A batch dialog shows the batch's own totals; each member's
+        # fraction and completion message would make it jump around.
+        if self._active_batch is not None and self._progress_dialog is self._active_batch.dialog:
+            return
         self._show_progress(fraction, message)
 
     def _on_operation_error(self, _manager, message: str) -> None:
@@ -2772,42 +3225,236 @@ class FileManagerWindow(Adw.Window):
         self, _manager, path: str, entries: Iterable[FileEntry]
     ) -> None:
         # Prefer the pane explicitly waiting for this exact path; otherwise
-        # assign to the next pane that still has a pending request. This makes
-        # initial dual loads robust even if the backend normalizes paths.
+        # a pane waiting for a "~" path, which the backend expands.
         target = next((pane for pane, pending in self._pending_paths.items() if pending == path), None)
         if target is None:
-            target = next((pane for pane, pending in self._pending_paths.items() if pending is not None), self._left_pane)
+            target = next(
+                (
+                    pane
+                    for pane, pending in self._pending_paths.items()
+                    if pending == "~" or (pending is not None and pending.startswith("~/"))
+                ),
+                None,
+            )
+        self._remember_remote_listing(path, entries)
+        if target is None:
+            # Superseded, e.g. the pane has since shown a cached listing;
+            # drawing it would replace what the user navigated to.
+            return
         # Clear the pending flag for the resolved pane
         self._pending_paths[target] = None
+        self._present_remote_listing(target, path, entries)
 
-        target.show_entries(path, entries)
-        self._apply_pending_highlight(target)
-        target.push_history(path)
-        target.show_toast(f"Loaded {path}")
+    def _present_remote_listing(
+        self, pane: FilePane, path: str, entries: Iterable[FileEntry]
+    ) -> None:
+        pane.show_entries(path, entries)
+        self._apply_pending_highlight(pane)
+        pane.push_history(path)
+        pane.show_toast(f"Loaded {path}")
+        self._request_item_counts(pane, path, entries)
+
+    def _request_item_counts(
+        self, pane: FilePane, path: str, entries: Iterable[FileEntry]
+    ) -> None:
+        """Fetch folder item counts after the listing itself is on screen."""
+        pending = [entry for entry in entries if entry.is_dir and entry.item_count is None]
+        if not pending:
+            return
+        previous = self._count_futures.get(pane)
+        if previous is not None:
+            # Only stops it if it hasn't started; a running count still
+            # lands in the cached entries of the directory it was for.
+            previous.cancel()
+        future = self._manager.count_directory_items(path, [entry.name for entry in pending])
+        self._count_futures[pane] = future
+
+        def _on_done(completed: Future) -> None:
+            if completed.cancelled():
+                return
+            try:
+                counts = completed.result()
+            except Exception:
+                return
+            GLib.idle_add(self._apply_item_counts, pane, path, pending, counts)
+
+        future.add_done_callback(_on_done)
+
+    def _apply_item_counts(
+        self,
+        pane: FilePane,
+        path: str,
+        entries: List[FileEntry],
+        counts: List[Optional[int]],
+    ) -> bool:
+        for entry, count in zip(entries, counts):
+            entry.item_count = count
+            entry.display = None
+        if pane._current_path == path:
+            pane.refresh_bound_rows()
+        return False
+
+    def _remember_remote_listing(self, path: str, entries: Iterable[FileEntry]) -> None:
+        cache = self._remote_dir_cache
+        cache[path] = (time.monotonic(), list(entries))
+        cache.move_to_end(path)
+        while len(cache) > self._DIR_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _forget_remote_listing(self, path: str) -> None:
+        """Drop cached listings of ``path`` and everything below it."""
+        prefix = path.rstrip("/") + "/"
+        cache = self._remote_dir_cache
+        for cached_path in [key for key in cache if key == path or key.startswith(prefix)]:
+            del cache[cached_path]
+
+    def _lookup_remote_listing(self, path: str) -> Optional[List[FileEntry]]:
+        cached = self._remote_dir_cache.get(path)
+        if cached is None:
+            return None
+        fetched_at, entries = cached
+        if time.monotonic() - fetched_at > self._REMOTE_CACHE_TTL:
+            del self._remote_dir_cache[path]
+            return None
+        self._remote_dir_cache.move_to_end(path)
+        return entries
 
     # -- local filesystem helpers ---------------------------------------
 
-    def _load_local(self, path: str) -> None:
+    def _load_local(
+        self, path: str, *, use_cache: bool = True, preserve_selection: bool = False
+    ) -> None:
         """Load local directory contents into the left pane.
 
-        This is a synchronous operation using the local filesystem.
+        The directory is scanned on a background worker and the result is
+        applied on the main loop.  A newer request supersedes any scan that
+        is still pending, so rapid navigation only renders the last path.
+        Pass ``use_cache=False`` after mutating the directory or on an
+        explicit refresh to force a rescan, and ``preserve_selection=True``
+        when the same directory is only rescanned for metadata.
+        """
+        previous = self._local_load_future
+        if previous is not None:
+            previous.cancel()
+        self._local_load_seq += 1
+        seq = self._local_load_seq
+        self._left_pane.set_loading(True)
+
+        future = self._local_executor.submit(
+            self._scan_local_directory,
+            path or "~",
+            use_cache,
+            self._left_pane.needs_metadata(),
+        )
+        self._local_load_future = future
+
+        def _on_done(completed: Future) -> None:
+            if not completed.cancelled():
+                GLib.idle_add(
+                    self._on_local_directory_loaded, seq, completed, preserve_selection
+                )
+
+        future.add_done_callback(_on_done)
+
+    def _scan_local_directory(
+        self, path: str, use_cache: bool, needs_metadata: bool = True
+    ) -> Tuple[str, List[FileEntry]]:
+        """Return a local listing, reusing the cache while the mtime matches.
+
+        Cached listings are only reused for ``_LOCAL_CACHE_TTL`` seconds and
+        are handed out as copies, since panes fill in the entries' row text.
+        When ``needs_metadata`` is false the entries are not stat'ed; a cached
+        name-only listing never satisfies a request that needs metadata.
+
+        THIS RUNS ON THE LOCAL WORKER THREAD.
         """
+        normalized = normalize_local_path(path)
         try:
-            normalized, entries = load_local_directory(path or "~")
-            self._left_pane.show_entries(normalized, entries)
-            self._apply_pending_highlight(self._left_pane)
+            mtime: Optional[int] = os.stat(normalized).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cache = self._local_dir_cache
+        if use_cache and mtime is not None:
+            with self._local_dir_cache_lock:
+                cached = cache.get(normalized)
+                if (
+                    cached is not None
+                    and time.monotonic() - cached[0] <= self._LOCAL_CACHE_TTL
+                    and cached[1] == mtime
+                    and (cached[2] or not needs_metadata)
+                ):
+                    cache.move_to_end(normalized)
+                    return normalized, [dataclasses.replace(entry) for entry in cached[3]]
+
+        normalized, entries = load_local_directory(normalized, needs_metadata)
+        if mtime is not None:
+            with self._local_dir_cache_lock:
+                cache[normalized] = (
+                    time.monotonic(),
+                    mtime,
+                    needs_metadata,
+                    [dataclasses.replace(entry) for entry in entries],
+                )
+                cache.move_to_end(normalized)
+                while len(cache) > self._DIR_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return normalized, entries
+
+    def _on_local_directory_loaded(
+        self, seq: int, future: Future, preserve_selection: bool = False
+    ) -> bool:
+        if seq != self._local_load_seq:
+            # A newer navigation is in flight; drop this stale result.
+            return False
+        self._local_load_future = None
+        self._left_pane.set_loading(False)
+        try:
+            normalized, entries = future.result()
         except Exception as exc:
             self._left_pane.show_toast(str(exc))
+            return False
+        self._left_pane.show_entries(
+            normalized, entries, preserve_selection=preserve_selection
+        )
+        self._apply_pending_highlight(self._left_pane)
+        # The view or sort may have changed to one that needs metadata while
+        # a name-only scan was pending
+        self._left_pane._ensure_local_metadata()
+        return False
+
+    def _on_local_delete_finished(self, pane: FilePane, base_dir: str, future: Future) -> bool:
+        try:
+            deleted, errors = future.result()
+        except Exception as exc:
+            pane.show_toast(str(exc))
+            return False
+        if deleted:
+            message = "Deleted 1 item" if deleted == 1 else f"Deleted {deleted} items"
+            pane.show_toast(message)
+            self._load_local(base_dir, use_cache=False)
+        if errors:
+            pane.show_toast(errors[0])
+        return False
 
     def _on_path_changed(self, pane: FilePane, path: str, user_data=None) -> None:
+        force = getattr(pane, "_force_refresh", False)
+        pane._force_refresh = False
         # Route local vs remote browsing
         if pane is self._left_pane:
             # Local pane: expand ~ and navigate local filesystem
-            local_path = os.path.expanduser(path) if path.startswith("~") else path
+            if path == "~":
+                local_path = self._local_home
+            elif path.startswith("~/"):
+                local_path = self._local_home.rstrip("/") + path[1:]
+            elif path.startswith("~"):
+                local_path = os.path.expanduser(path)
+            else:
+                local_path = path
             if not local_path:
-                local_path = os.path.expanduser("~")
+                local_path = self._local_home
             try:
-                self._load_local(local_path)
+                self._load_local(local_path, use_cache=not force)
                 # Only push history if not triggered by Back
                 if getattr(pane, "_suppress_history_push", False):
                     pane._suppress_history_push = False
@@ -2817,13 +3464,20 @@ class FileManagerWindow(Adw.Window):
                 pane.show_toast(str(exc))
         else:
             # Remote pane: use SFTP manager
-            self._pending_paths[pane] = path
             # Only push history if not triggered by Back
             if getattr(pane, "_suppress_history_push", False):
                 pane._suppress_history_push = False
             else:
                 pane.push_history(path)
-            self._manager.listdir(path)
+            cached = None if force else self._lookup_remote_listing(path)
+            if cached is not None:
+                # A listing still in flight for an earlier path must not
+                # land on top of this one
+                self._pending_paths[pane] = None
+                self._present_remote_listing(pane, path, cached)
+            else:
+                self._pending_paths[pane] = path
+                self._manager.listdir(path)
 
     def _check_file_conflicts(self, files_to_transfer: List[Tuple[str, str]], operation_type: str, callback: Callable[[List[Tuple[str, str]]], None]) -> None:
         """Check for file conflicts and show resolution dialog if needed.
@@ -2838,22 +3492,38 @@ class FileManagerWindow(Adw.Window):
         print(f"Files to transfer: {files_to_transfer}")
         
         conflicts = []
+        # Filled in the same pass so "Skip Existing" needs no second scan
+        non_conflicting = []
         
-        # Check for conflicts
-        for source, dest in files_to_transfer:
-            print(f"Checking: {source} -> {dest}")
-            if operation_type == "download":
-                # For downloads, check if local file exists
-                exists = os.path.exists(dest)
-                print(f"  Local file exists: {exists}")
-                if exists:
-                    conflicts.append((source, dest))
-                    print(f"  CONFLICT DETECTED: {dest}")
-            else:  # upload
-                # For uploads, we'd need to check remote files - this is more complex
-                # For now, let the upload proceed (remote conflict handling would require SFTP stat calls)
-                print(f"  Upload conflict checking not implemented yet")
-                pass
+        if operation_type == "download":
+            # One directory read per destination folder instead of a stat per
+            # file.  The listing is deliberately not kept beyond this check so
+            # a stale cache can never hide a real conflict.
+            existing_by_dir: Dict[str, Optional[set[str]]] = {}
+            for source, dest in files_to_transfer:
+                parent, name = os.path.split(dest)
+                if parent in existing_by_dir:
+                    existing = existing_by_dir[parent]
+                else:
+                    try:
+                        with os.scandir(parent or ".") as it:
+                            existing = {dirent.name for dirent in it}
+                    except FileNotFoundError:
+                        existing = set()
+                    except OSError:
+                        # Unreadable (e.g. search-only) folder: probe per file
+                        existing = None
+                    existing_by_dir[parent] = existing
+                if existing is None:
+                    # lexists is a single lstat and doesn't chase symlinks
+                    is_conflict = os.path.lexists(dest)
+                else:
+                    is_conflict = name in existing
+                (conflicts if is_conflict else non_conflicting).append((source, dest))
+        else:  # upload
+            # For uploads, we'd need to check remote files - this is more complex
+            # For now, let the upload proceed (remote conflict handling would require SFTP stat calls)
+            print("Upload conflict checking not implemented yet")
         
         print(f"Total conflicts found: {len(conflicts)}")
         
@@ -2889,7 +3559,6 @@ class FileManagerWindow(Adw.Window):
                 return
             elif response == "skip":
                 # Only transfer files that don't conflict
-                non_conflicting = [item for item in files_to_transfer if item not in conflicts]
                 if non_conflicting:
                     callback(non_conflicting)
                     # Show toast about skipped files
@@ -2935,7 +3604,7 @@ class FileManagerWindow(Adw.Window):
                             else:
                                 # Refresh local listing
                                 self._pending_highlights[self._left_pane] = name
-                                self._load_local(os.path.dirname(new_path) or "/")
+                                self._load_local(os.path.dirname(new_path) or "/", use_cache=False)
                         else:
                             future = self._manager.mkdir(new_path)
                             self._attach_refresh(
@@ -2994,8 +3663,10 @@ class FileManagerWindow(Adw.Window):
                     else:
                         pane.show_toast(f"Renamed to {new_name}")
                         self._pending_highlights[self._left_pane] = new_name
-                        self._load_local(base_dir)
+                        self._load_local(base_dir, use_cache=False)
                 else:
+                    if entry.is_dir:
+                        self._forget_remote_listing(source)
                     future = self._manager.rename(source, target)
                     self._attach_refresh(
                         future,
@@ -3037,35 +3708,26 @@ class FileManagerWindow(Adw.Window):
                     dialog.close()
                     return
                 if pane is self._left_pane:
-                    deleted = 0
-                    errors: List[str] = []
-                    for selected_entry in entries:
-                        target_path = os.path.join(base_dir, selected_entry.name)
-                        try:
-                            if selected_entry.is_dir:
-                                shutil.rmtree(target_path)
-                            else:
-                                os.remove(target_path)
-                            deleted += 1
-                        except FileNotFoundError:
-                            errors.append(f"{selected_entry.name} no longer exists")
-                        except Exception as exc:
-                            errors.append(str(exc))
-                    if deleted:
-                        message = (
-                            "Deleted 1 item"
-                            if deleted == 1
-                            else f"Deleted {deleted} items"
+                    # Run the whole batch on the local worker; it queues behind
+                    # any pending scan so the follow-up refresh sees the result.
+                    future = self._local_executor.submit(
+                        remove_local_entries, base_dir, list(entries)
+                    )
+                    future.add_done_callback(
+                        lambda fut: GLib.idle_add(
+                            self._on_local_delete_finished, pane, base_dir, fut
                         )
-                        pane.show_toast(message)
-                        self._load_local(base_dir)
-                    if errors:
-                        pane.show_toast(errors[0])
+                    )
                 else:
-                    for selected_entry in entries:
-                        target_path = posixpath.join(base_dir, selected_entry.name)
-                        future = self._manager.remove(target_path)
-                        self._attach_refresh(future, refresh_remote=pane)
+                    paths = [
+                        posixpath.join(base_dir, selected_entry.name)
+                        for selected_entry in entries
+                    ]
+                    for selected_entry, path in zip(entries, paths):
+                        if selected_entry.is_dir:
+                            self._forget_remote_listing(path)
+                    future = self._manager.remove_many(paths)
+                    self._attach_refresh(future, refresh_remote=pane, refresh_on_error=True)
                     pane.show_toast(
                         "Deleting 1 item…" if count == 1 else f"Deleting {count} items…"
                     )
@@ -3084,86 +3746,37 @@ class FileManagerWindow(Adw.Window):
             else:
                 return
 
-            remote_root = target_pane.toolbar.path_entry.get_text() or "/"
-            raw_items: object | None = None
-
-            if isinstance(payload, dict):
-                destination = payload.get("destination")
-                if isinstance(destination, pathlib.Path):
-                    remote_root = destination.as_posix()
-                elif isinstance(destination, str) and destination:
-                    remote_root = destination
-                raw_items = payload.get("paths")
-            else:
-                raw_items = payload
-
-            paths: List[pathlib.Path] = []
-
-            def _collect(item: object | None) -> None:
-                if item is None:
-                    return
-                if isinstance(item, (list, tuple, set, frozenset)):
-                    for value in item:
-                        _collect(value)
-                    return
-                if isinstance(item, pathlib.Path):
-                    paths.append(item)
-                elif isinstance(item, Gio.File):
-                    local_path = item.get_path()
-                    if local_path:
-                        paths.append(pathlib.Path(local_path))
-                elif isinstance(item, str):
-                    paths.append(pathlib.Path(item))
-
-            _collect(raw_items)
+            paths, remote_root = _normalize_upload_payload(
+                payload, target_pane.toolbar.path_entry.get_text() or "/"
+            )
 
             if not paths:
                 pane.show_toast("No files selected for upload")
                 return
 
-            available_paths: List[pathlib.Path] = []
-            missing: List[pathlib.Path] = []
+            available_paths: List[str] = []
+            missing: List[str] = []
             for candidate in paths:
-                try:
-                    if candidate.exists():
-                        available_paths.append(candidate)
-                    else:
-                        missing.append(candidate)
-                except OSError:
+                if os.path.exists(candidate):
+                    available_paths.append(candidate)
+                else:
                     missing.append(candidate)
 
             if missing and not available_paths:
                 pane.show_toast("Selected items are not accessible")
                 return
             if missing and available_paths:
-                pane.show_toast(f"Skipping inaccessible items: {missing[0].name}")
+                pane.show_toast(f"Skipping inaccessible items: {os.path.basename(missing[0])}")
 
             # Prepare list of files to transfer for conflict checking
             files_to_transfer = []
-            for path_obj in available_paths:
-                destination = posixpath.join(remote_root or "/", path_obj.name)
-                files_to_transfer.append((str(path_obj), destination))
+            for local_path in available_paths:
+                destination = posixpath.join(remote_root or "/", os.path.basename(local_path))
+                files_to_transfer.append((local_path, destination))
             
             # Check for conflicts and handle accordingly  
             def _proceed_with_upload(resolved_files: List[Tuple[str, str]]) -> None:
-                for local_path_str, destination in resolved_files:
-                    path_obj = pathlib.Path(local_path_str)
-                    
-                    try:
-                        if path_obj.is_dir():
-                            future = self._manager.upload_directory(path_obj, destination)
-                        else:
-                            future = self._manager.upload(path_obj, destination)
-
-                        # Show progress dialog for upload
-                        self._show_progress_dialog("upload", path_obj.name, future)
-                        self._attach_refresh(
-                            future,
-                            refresh_remote=target_pane,
-                            highlight_name=path_obj.name,
-                        )
-                    except Exception as e:
-                        pane.show_toast(f"Error uploading {path_obj.name}: {str(e)}")
+                self._upload_files_concurrently(target_pane, resolved_files)
             
             self._check_file_conflicts(files_to_transfer, "upload", _proceed_with_upload)
         elif action == "download" and isinstance(payload, dict):
@@ -3194,42 +3807,19 @@ class FileManagerWindow(Adw.Window):
                 pane.show_toast("Invalid download request")
                 return
 
-            if not isinstance(destination_base, pathlib.Path):
-                destination_base = pathlib.Path(destination_base)
+            # Local paths stay strings; ``Path`` is only built for the manager.
+            destination_base = os.fspath(destination_base)
 
             # Prepare list of files to transfer for conflict checking
             files_to_transfer = []
             for entry in entries:
                 source = posixpath.join(directory or "/", entry.name)
-                target_path = destination_base / entry.name
-                files_to_transfer.append((source, str(target_path)))
+                target_path = os.path.join(destination_base, entry.name)
+                files_to_transfer.append((source, target_path))
             
             # Check for conflicts and handle accordingly
             def _proceed_with_download(resolved_files: List[Tuple[str, str]]) -> None:
-                for source, target_path_str in resolved_files:
-                    target_path = pathlib.Path(target_path_str)
-                    entry_name = os.path.basename(target_path_str)
-                    
-                    # Find the original entry to check if it's a directory
-                    entry_is_dir = False
-                    for entry in entries:
-                        if entry.name == entry_name:
-                            entry_is_dir = entry.is_dir
-                            break
-                    
-                    try:
-                        if entry_is_dir:
-                            future = self._manager.download_directory(source, target_path)
-                        else:
-                            future = self._manager.download(source, target_path)
-                        self._show_progress_dialog("download", entry_name, future)
-                        self._attach_refresh(
-                            future,
-                            refresh_local_path=str(destination_base),
-                            highlight_name=entry_name,
-                        )
-                    except Exception as e:
-                        pane.show_toast(f"Error downloading {entry_name}: {str(e)}")
+                self._download_files_concurrently(entries, resolved_files, destination_base)
             
             self._check_file_conflicts(files_to_transfer, "download", _proceed_with_download)
 
@@ -3248,7 +3838,14 @@ class FileManagerWindow(Adw.Window):
         refresh_remote: Optional[FilePane] = None,
         refresh_local_path: Optional[str] = None,
         highlight_name: Optional[str] = None,
+        refresh_on_error: bool = False,
     ) -> None:
+        """Refresh the affected pane once ``future`` succeeds.
+
+        With ``refresh_on_error`` the pane is refreshed even if the future
+        fails, for batches where the members that did succeed still changed
+        the listing.
+        """
         if future is None:
             return
 
@@ -3256,19 +3853,48 @@ class FileManagerWindow(Adw.Window):
             try:
                 completed.result()
             except Exception:
-                return
+                if not refresh_on_error:
+                    return
             if highlight_name:
                 if refresh_remote is not None:
                     self._pending_highlights[refresh_remote] = highlight_name
                 elif refresh_local_path is not None:
                     self._pending_highlights[self._left_pane] = highlight_name
             if refresh_remote is not None:
-                GLib.idle_add(self._refresh_remote_listing, refresh_remote)
+                GLib.idle_add(
+                    self._schedule_refresh,
+                    refresh_remote,
+                    self._refresh_remote_listing,
+                    refresh_remote,
+                )
             if refresh_local_path:
-                GLib.idle_add(self._refresh_local_listing, refresh_local_path)
+                GLib.idle_add(
+                    self._schedule_refresh,
+                    refresh_local_path,
+                    self._refresh_local_listing,
+                    refresh_local_path,
+                )
 
         future.add_done_callback(_on_done)
 
+    def _schedule_refresh(self, key: object, callback: Callable[..., bool], *args) -> bool:
+        """Run ``callback(*args)`` once after a short delay.
+
+        Requests for the same ``key`` arriving while one is already pending
+        are folded into it.  Returns ``False`` so it can be passed straight
+        to ``GLib.idle_add``.
+        """
+        if key not in self._refresh_sources:
+            self._refresh_sources[key] = GLib.timeout_add(
+                self._REFRESH_DEBOUNCE_MS, self._run_scheduled_refresh, key, callback, args
+            )
+        return False
+
+    def _run_scheduled_refresh(self, key: object, callback: Callable[..., bool], args: tuple) -> bool:
+        self._refresh_sources.pop(key, None)
+        callback(*args)
+        return False
+
     def _apply_pending_highlight(self, pane: FilePane) -> None:
         name = self._pending_highlights.get(pane)
         if not name:
@@ -3286,103 +3912,148 @@ class FileManagerWindow(Adw.Window):
         target = self._normalize_local_path(path)
         current = self._normalize_local_path(self._left_pane.toolbar.path_entry.get_text())
         if target == current:
-            self._load_local(target)
+            self._load_local(target, use_cache=False)
         else:
             self._pending_highlights[self._left_pane] = None
         return False
 
     
-    def _show_progress_dialog(self, operation_type: str, filename: str, future: Future) -> None:
-        """Show and manage the progress dialog for a file operation."""
-        try:
-            print(f"DEBUG: _show_progress_dialog called for {operation_type} {filename}")
-            
-            # Dismiss any existing progress dialog
-            if hasattr(self, '_progress_dialog') and self._progress_dialog:
+    def _upload_files_concurrently(
+        self,
+        target_pane: FilePane,
+        resolved_files: List[Tuple[str, str]],
+    ) -> None:
+        """Start every upload in ``resolved_files`` as one transfer batch."""
+        jobs: List[TransferJob] = []
+        transferred: List[int] = []
+        total_bytes = 0
+
+        for local_path_str, destination in resolved_files:
+            name = os.path.basename(local_path_str)
+            is_directory = os.path.isdir(local_path_str)
+            if is_directory:
+                start = functools.partial(
+                    self._manager.upload_directory, pathlib.Path(local_path_str), destination
+                )
+            else:
                 try:
-                    self._progress_dialog.close()
-                except (AttributeError, RuntimeError):
+                    total_bytes += os.path.getsize(local_path_str)
+                except OSError:
                     pass
-                self._progress_dialog = None
-            
-            # Create new progress dialog
-            print(f"DEBUG: Creating progress dialog")
-            self._progress_dialog = SFTPProgressDialog(parent=self, operation_type=operation_type)
-            self._progress_dialog.set_operation_details(total_files=1, filename=filename)
-            self._progress_dialog.set_future(future)
-            
-            # Try to get file size for better progress display
-            try:
-                if operation_type == "download":
-                    # For downloads, we'll get the size from the SFTP manager if available
-                    # This is a rough estimate, the actual implementation would need to
-                    # query the remote file size
-                    self._progress_dialog.total_bytes = 1024 * 1024  # Default to 1MB estimate
-                else:  # upload
-                    # For uploads, we could get the local file size
-                    self._progress_dialog.total_bytes = 1024 * 1024  # Default to 1MB estimate
-            except Exception:
-                self._progress_dialog.total_bytes = 0
-            
-            # Show the dialog
-            self._progress_dialog.present()
-            print(f"DEBUG: Progress dialog created and shown successfully")
-            
-        except Exception as exc:
-            print(f"DEBUG: Error in _show_progress_dialog: {exc}")
-            import traceback
-            traceback.print_exc()
+                start = functools.partial(
+                    self._manager.upload,
+                    pathlib.Path(local_path_str),
+                    destination,
+                    on_progress=self._batch_progress_slot(transferred),
+                )
+            jobs.append((name, start, is_directory))
+
+        def _on_started(future: Future, name: str) -> None:
+            self._attach_refresh(future, refresh_remote=target_pane, highlight_name=name)
+
+        self._run_transfer_batch("upload", jobs, transferred, total_bytes, _on_started)
+
+    def _download_files_concurrently(
+        self,
+        entries: List[FileEntry],
+        resolved_files: List[Tuple[str, str]],
+        destination_base: str,
+    ) -> None:
+        """Start every download in ``resolved_files`` as one transfer batch."""
+        entries_by_name = {entry.name: entry for entry in entries}
+        jobs: List[TransferJob] = []
+        transferred: List[int] = []
+        total_bytes = 0
+
+        for source, target_path_str in resolved_files:
+            entry_name = os.path.basename(target_path_str)
+            entry = entries_by_name.get(entry_name)
+            target_path = pathlib.Path(target_path_str)
+            is_directory = entry is not None and entry.is_dir
+            if is_directory:
+                start = functools.partial(self._manager.download_directory, source, target_path)
+            else:
+                if entry is not None and entry.size > 0:
+                    total_bytes += entry.size
+                start = functools.partial(
+                    self._manager.download,
+                    source,
+                    target_path,
+                    on_progress=self._batch_progress_slot(transferred),
+                    known_size=entry.size if entry is not None else None,
+                )
+            jobs.append((entry_name, start, is_directory))
+
+        def _on_started(future: Future, name: str) -> None:
+            self._attach_refresh(
+                future, refresh_local_path=destination_base, highlight_name=name
+            )
+
+        self._run_transfer_batch("download", jobs, transferred, total_bytes, _on_started)
+
+    @staticmethod
+    def _batch_progress_slot(transferred: List[int]) -> Callable[[int, int], None]:
+        """Reserve a byte counter in ``transferred`` and return its updater."""
+        slot = len(transferred)
+        transferred.append(0)
+
+        def _on_progress(done: int, _total: int) -> None:
+            transferred[slot] = done
+
+        return _on_progress
+
+    def _run_transfer_batch(
+        self,
+        operation_type: str,
+        jobs: List[TransferJob],
+        transferred: List[int],
+        total_bytes: int,
+        on_started: Callable[[Future, str], None],
+    ) -> None:
+        """Show one progress dialog and start ``jobs`` as a :class:`_TransferBatch`.
+
+        Byte counts from all transfers are summed and pushed to the dialog
+        at most every ``_PROGRESS_INTERVAL_MS``.
+        """
+        if not jobs:
             return
-        
-        # Store references for cleanup
-        self._progress_handler_id = None
-        
-        # Connect progress signal
-        def _on_progress(manager, progress: float, message: str) -> None:
-            # Check if dialog exists and operation hasn't been cancelled
-            if (self._progress_dialog and 
-                not self._progress_dialog.is_cancelled and
-                self._current_future and 
-                not self._current_future.cancelled()):
-                try:
-                    self._progress_dialog.update_progress(progress, message)
-                except (AttributeError, RuntimeError, GLib.GError):
-                    # Dialog may have been destroyed
-                    pass
-        
-        # Connect progress signal and store handler ID
-        self._progress_handler_id = self._manager.connect("progress", _on_progress)
-        
-        def _on_complete(future_result) -> None:
-            # Use GLib.idle_add to ensure we're on the main thread
-            def _cleanup():
-                # Disconnect progress signal
-                if hasattr(self, '_progress_handler_id') and self._progress_handler_id:
-                    try:
-                        self._manager.disconnect(self._progress_handler_id)
-                    except (TypeError, RuntimeError):
-                        pass
-                    self._progress_handler_id = None
-                
-                # Update dialog to show completion
-                if self._progress_dialog:
-                    try:
-                        if future_result.exception():
-                            error_msg = str(future_result.exception())
-                            self._progress_dialog.show_completion(success=False, error_message=error_msg)
-                        else:
-                            self._progress_dialog.increment_file_count()
-                            self._progress_dialog.show_completion(success=True)
-                    except (AttributeError, RuntimeError, GLib.GError):
-                        # Dialog may have been destroyed
-                        pass
-                
-                self._current_future = None
-            
-            GLib.idle_add(_cleanup)
-        
-        # Connect future completion
-        future.add_done_callback(_on_complete)
+        # Earlier batches keep their own dialogs; every dialog is fed by its
+        # batch alone, never by the manager's per-file progress messages.
+        dialog = SFTPProgressDialog(parent=self, operation_type=operation_type)
+        self._progress_dialog = dialog
+        self._progress_dialogs.add(dialog)
+        dialog.set_operation_details(
+            total_files=len(jobs),
+            filename=jobs[0][0] if len(jobs) == 1 else f"{len(jobs)} items",
+        )
+        dialog.set_total_bytes(total_bytes)
+
+        batch = _TransferBatch(
+            dialog,
+            jobs,
+            transferred,
+            total_bytes,
+            "Downloading…" if operation_type == "download" else "Uploading…",
+            self._active_transfers,
+            on_started,
+        )
+        dialog.set_future(batch)
+        self._active_batch = batch
+        batch.start(self._PROGRESS_INTERVAL_MS)
+        dialog.present()
+
+    def _on_close_request(self, _window) -> bool:
+        for future in list(self._active_transfers):
+            future.cancel()
+        self._active_transfers.clear()
+        for dialog in list(self._progress_dialogs):
+            try:
+                dialog.close()
+            except (AttributeError, RuntimeError, GLib.GError):
+                pass
+        self._local_executor.shutdown(wait=False, cancel_futures=True)
+        self._manager.close()
+        return False
 
     @staticmethod
     def _normalize_local_path(path: Optional[str]) -> str:
@@ -0,0 +1,113 @@
+import pathlib
+import stat
+import tarfile
+import tempfile
+import threading
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("gi")
+paramiko = pytest.importorskip("paramiko")
+
+from mfatfm.connection import (
+    _TAR_HAS_DATA_FILTER,
+    _TAR_MIN_FILES,
+    AsyncSFTPManager,
+    _SharedClient,
+    _tar_extract_filter,
+)
+
+
+def _file_attr(name: str) -> paramiko.SFTPAttributes:
+    attr = paramiko.SFTPAttributes()
+    attr.filename = name
+    attr.st_mode = stat.S_IFREG | 0o644
+    attr.st_size = 1
+    return attr
+
+
+@pytest.fixture
+def sftp():
+    sftp = mock.Mock()
+    sftp.get_channel.return_value.closed = False
+    return sftp
+
+
+@pytest.fixture
+def manager(sftp):
+    """A connected-looking manager whose server refuses exec channels."""
+    manager = AsyncSFTPManager("example.com", "user", dispatcher=lambda f, a, k: f(*a, **k))
+    transport = mock.Mock()
+    transport.is_active.return_value = True
+    transport.open_session.side_effect = paramiko.ChannelException(
+        1, "Administratively prohibited"
+    )
+    client = mock.Mock()
+    client.get_transport.return_value = transport
+    client.open_sftp.return_value = sftp
+    manager._shared = _SharedClient(client)
+    manager._remote_tar = True
+    yield manager
+    manager.close()
+
+
+def test_download_directory_falls_back_when_exec_is_refused(manager, sftp):
+    sftp.listdir_attr.return_value = [_file_attr(f"f{i}") for i in range(_TAR_MIN_FILES)]
+    with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+        AsyncSFTPManager, "_get_file"
+    ) as get_file:
+        manager.download_directory("/src", pathlib.Path(tmp)).result(timeout=5)
+    assert get_file.call_count == _TAR_MIN_FILES
+    assert manager._remote_tar is False
+
+
+def test_upload_directory_falls_back_when_exec_is_refused(manager):
+    with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+        AsyncSFTPManager, "_put_file"
+    ) as put_file:
+        for i in range(_TAR_MIN_FILES):
+            (pathlib.Path(tmp) / f"f{i}").write_bytes(b"x")
+        manager.upload_directory(pathlib.Path(tmp), "/dst").result(timeout=5)
+    assert put_file.call_count == _TAR_MIN_FILES
+    assert manager._remote_tar is False
+
+
+def _symlink_member(name: str, target: str) -> "tarfile.TarInfo":
+    member = tarfile.TarInfo(name)
+    member.type = tarfile.SYMTYPE
+    member.linkname = target
+    return member
+
+
+@pytest.mark.skipif(not _TAR_HAS_DATA_FILTER, reason="tarfile has no data filter")
+def test_tar_extract_filter_skips_links_leaving_the_destination(tmp_path):
+    assert _tar_extract_filter(_symlink_member("root", "/"), str(tmp_path)) is None
+    assert _tar_extract_filter(_symlink_member("up", "../.."), str(tmp_path)) is None
+    inside = _tar_extract_filter(_symlink_member("sub/link", "../file"), str(tmp_path))
+    assert inside is not None and inside.linkname == "../file"
+
+
+def _open_channel() -> mock.Mock:
+    channel = mock.Mock()
+    channel.get_channel.return_value.closed = False
+    return channel
+
+
+def test_shared_client_waits_for_a_channel_at_the_limit():
+    client = mock.Mock()
+    client.open_sftp.side_effect = _open_channel
+    shared = _SharedClient(client)
+    channels = [shared.checkout() for _ in range(_SharedClient.MAX_CHANNELS)]
+    assert client.open_sftp.call_count == _SharedClient.MAX_CHANNELS
+
+    waiting = []
+    waiter = threading.Thread(target=lambda: waiting.append(shared.checkout()))
+    waiter.start()
+    waiter.join(0.2)
+    assert waiter.is_alive()
+
+    shared.checkin(channels[0])
+    waiter.join(5)
+    assert waiting == [channels[0]]
+    assert client.open_sftp.call_count == _SharedClient.MAX_CHANNELS